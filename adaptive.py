@@ -0,0 +1,93 @@
+# adaptive.py - 사용자별 취약 유형 학습 모듈
+
+import base64
+from array import array
+
+import numpy as np
+
+from config import AdaptiveConfig
+
+# 연산자 수 (덧셈, 뺄셈) x 첫째 수 일의 자리 x 둘째 수 일의 자리
+PATTERN_SHAPE = (2, 10, 10)
+PATTERN_COUNT = 2 * 10 * 10
+
+# 유형별 기록 횟수 상한 (unsigned short)
+_MAX_ATTEMPTS = 0xFFFF
+
+class AdaptiveModel:
+    """
+    사용자별 취약 유형 모델
+    
+    문제를 (연산자, 두 수의 일의 자리) 유형 200개로 나누고, 유형별로 오답과
+    느린 응답을 지수 이동 평균한 취약도(0~1)를 고정 크기 배열에 보관합니다.
+    답안마다 한 칸만 갱신하므로 O(1)이며 메모리는 사용자당 약 1.2KB로 일정합니다.
+    
+    갱신은 NumPy 스칼라 연산보다 빠른 array 모듈 배열에 직접 하고, 출제
+    가중치는 같은 버퍼를 NumPy 배열로 보아 복사 없이 계산합니다.
+    """
+    
+    __slots__ = ('weakness', 'attempts')
+    
+    def __init__(self):
+        self.weakness = array('f', [0.0]) * PATTERN_COUNT
+        self.attempts = array('H', [0]) * PATTERN_COUNT
+    
+    def snapshot(self) -> str:
+        """
+        출제 가중치 계산에 쓰이는 취약도 배열 스냅샷 (float32 바이트의 base64 문자열)
+        
+        Returns:
+            str: from_snapshot()으로 복원할 수 있는 문자열
+        """
+        return base64.b64encode(self.weakness.tobytes()).decode('ascii')
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: str) -> 'AdaptiveModel':
+        """
+        스냅샷으로 취약도를 복원한 모델 생성 (기록 횟수는 복원하지 않음)
+        
+        Args:
+            snapshot: snapshot()이 반환한 문자열
+        
+        Returns:
+            AdaptiveModel: 같은 출제 가중치를 내는 모델
+        """
+        weakness = array('f')
+        weakness.frombytes(base64.b64decode(snapshot))
+        if len(weakness) != PATTERN_COUNT:
+            raise ValueError("취약 유형 모델 스냅샷 크기가 올바르지 않습니다.")
+        model = cls()
+        model.weakness = weakness
+        return model
+    
+    def record(self, op_code: int, num1: int, num2: int, is_correct: bool, time_ratio: float):
+        """
+        답안 결과 반영
+        
+        Args:
+            op_code: 연산자 코드
+            num1: 첫째 수
+            num2: 둘째 수
+            is_correct: 정답 여부
+            time_ratio: 응답 시간 / 제한 시간 (시간 초과면 1 이상)
+        """
+        cell = op_code * 100 + (num1 % 10) * 10 + num2 % 10
+        observation = min(time_ratio, 1.0) if is_correct else 1.0
+        
+        self.weakness[cell] += AdaptiveConfig.LEARNING_RATE * (observation - self.weakness[cell])
+        if self.attempts[cell] < _MAX_ATTEMPTS:
+            self.attempts[cell] += 1
+    
+    def pattern_weights(self, op_code: int) -> np.ndarray:
+        """
+        연산자별 유형 출제 가중치 (일의 자리 조합 10 x 10)
+        
+        취약도가 높은 유형일수록 최대 (1 + BIAS_STRENGTH)배까지 자주 출제됩니다.
+        """
+        weakness = np.frombuffer(self.weakness, dtype=np.float32).reshape(PATTERN_SHAPE)
+        return 1.0 + AdaptiveConfig.BIAS_STRENGTH * weakness[op_code]
+    
+    @property
+    def has_data(self) -> bool:
+        """기록된 답안이 있는지 여부"""
+        return any(self.attempts)
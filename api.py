@@ -0,0 +1,385 @@
+# api.py - HTTP/JSON 게임 API (Streamlit 화면 없이 게임 진행)
+#
+# 실행: python api.py [--host 127.0.0.1] [--port 8000]
+# app은 표준 ASGI 애플리케이션이므로 uvicorn 등에서도 실행 가능 (uvicorn api:app)
+#
+# 엔드포인트
+#   POST /games                        게임 시작
+#   GET  /games/{session_id}/question  현재 문제
+#   POST /games/{session_id}/answers   답안 제출 (다음 문제로 이동)
+#   GET  /games/{session_id}/results   최종 결과 (결과 저장 포함)
+#   GET  /health                       상태 확인
+#   GET  /metrics                      구간별 실행 시간 (Prometheus 텍스트 형식, GAME_INSTRUMENTATION=1)
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import uuid
+from http import HTTPStatus
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+from config import ApiConfig, AdaptiveConfig, GameConfig, UIConfig
+from game_logic import GameSession, SessionRegistry
+from instrumentation import timing_recorder
+from sheets_manager import SheetsManager, sheets_manager
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = [(b"content-type", b"application/json; charset=utf-8")]
+_PROMETHEUS_HEADERS = [(b"content-type", b"text/plain; version=0.0.4; charset=utf-8")]
+
+class ApiError(Exception):
+    """HTTP 오류 응답으로 변환되는 예외"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class GameApi:
+    """
+    GameSession과 SheetsManager를 사용하는 ASGI 애플리케이션
+    
+    게임 세션은 API 전용 SessionRegistry에 세션 ID별로 보관하며, 결과 저장은
+    이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
+    """
+    
+    def __init__(self, registry: Optional[SessionRegistry] = None,
+                 manager: Optional[SheetsManager] = None):
+        """
+        Args:
+            registry: 게임 세션 저장소 (없으면 새로 생성)
+            manager: 결과를 저장할 SheetsManager (없으면 전역 인스턴스)
+        """
+        self.registry = registry if registry is not None else SessionRegistry(max_sessions=ApiConfig.MAX_SESSIONS)
+        self.manager = manager if manager is not None else sheets_manager
+    
+    async def __call__(self, scope: Dict[str, Any], receive, send):
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        
+        try:
+            body = await self._read_body(receive)
+            status, payload = await self.dispatch(scope["method"], scope["path"], body)
+        except ApiError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            logger.error(f"API 요청 처리 실패: {str(e)}")
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "서버 오류가 발생했습니다"}
+        
+        # 문자열 응답은 메트릭 텍스트, 그 외는 JSON
+        if isinstance(payload, str):
+            data, headers = payload.encode("utf-8"), _PROMETHEUS_HEADERS
+        else:
+            data, headers = json.dumps(payload, ensure_ascii=False).encode("utf-8"), _JSON_HEADERS
+        await send({
+            "type": "http.response.start",
+            "status": int(status),
+            "headers": headers + [(b"content-length", str(len(data)).encode("ascii"))]
+        })
+        await send({"type": "http.response.body", "body": data})
+    
+    @staticmethod
+    async def _handle_lifespan(receive, send):
+        """ASGI 서버의 시작/종료 알림 처리"""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        """요청 본문 읽기 (MAX_BODY_SIZE 초과 시 오류)"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > ApiConfig.MAX_BODY_SIZE:
+                raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "요청 본문이 너무 큽니다")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+    
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Union[Dict[str, Any], str]]:
+        """
+        경로와 메서드에 맞는 처리 함수 호출
+        
+        Returns:
+            Tuple[int, Union[Dict, str]]: (HTTP 상태 코드, 응답 데이터 또는 메트릭 텍스트)
+        """
+        parts = path.strip("/").split("/")
+        
+        if parts == ["health"] and method == "GET":
+            return HTTPStatus.OK, {"status": "ok", "sessions": len(self.registry)}
+        
+        if parts == ["metrics"] and method == "GET":
+            if not timing_recorder.enabled:
+                raise ApiError(HTTPStatus.NOT_FOUND, "계측이 꺼져 있습니다 (GAME_INSTRUMENTATION=1)")
+            return HTTPStatus.OK, timing_recorder.render_prometheus()
+        
+        if parts == ["games"] and method == "POST":
+            return HTTPStatus.CREATED, self.start_game(self._parse_json(body))
+        
+        if len(parts) == 3 and parts[0] == "games":
+            session = self._get_session(parts[1])
+            action = (method, parts[2])
+            if action == ("GET", "question"):
+                return HTTPStatus.OK, self.get_question(session)
+            if action == ("POST", "answers"):
+                return HTTPStatus.OK, self.submit_answer(session, self._parse_json(body))
+            if action == ("GET", "results"):
+                return HTTPStatus.OK, await self.get_results(session)
+        
+        raise ApiError(HTTPStatus.NOT_FOUND, "요청한 경로를 찾을 수 없습니다")
+    
+    @staticmethod
+    def _parse_json(body: bytes) -> Dict[str, Any]:
+        """요청 본문을 JSON 객체로 변환 (본문이 없으면 빈 객체)"""
+        if not body:
+            return {}
+        try:
+            data = json.loads(body)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "요청 본문이 올바른 JSON이 아닙니다")
+        if not isinstance(data, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "요청 본문은 JSON 객체여야 합니다")
+        return data
+    
+    def _get_session(self, session_id: str) -> GameSession:
+        """세션 ID에 해당하는 게임 세션 반환 (없으면 404)"""
+        session = self.registry.find(session_id)
+        if session is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "게임 세션을 찾을 수 없습니다")
+        return session
+    
+    @timing_recorder.timed("api.start_game")
+    def start_game(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        게임 시작
+        
+        같은 session_id로 다시 시작하면 이전 게임의 취약 유형 기록이 이어집니다.
+        seed를 지정하면 취약 유형 출제를 끄므로 같은 설정에서 항상 같은 문제
+        세트가 나옵니다.
+        """
+        session_id = data.get("session_id")
+        session = self.registry.find(session_id) if isinstance(session_id, str) else None
+        if session is None:
+            session_id = uuid.uuid4().hex
+            session = self.registry.get(session_id)
+        
+        try:
+            seed = data.get("seed")
+            session.start_game(
+                str(data.get("operation_type", UIConfig.OPERATION_TYPES[0])),
+                int(data.get("question_count", GameConfig.DEFAULT_QUESTIONS)),
+                int(data.get("time_limit", GameConfig.DEFAULT_TIME_LIMIT)),
+                difficulty=data.get("difficulty"),
+                adaptive=AdaptiveConfig.ENABLED and seed is None,
+                seed=None if seed is None else int(seed)
+            )
+        except (TypeError, ValueError) as e:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"설정 오류: {str(e)}")
+        
+        return {
+            "session_id": session_id,
+            "game_id": session.game_id,
+            "seed": session.seed,
+            "total_questions": len(session.questions),
+            "time_limit": session.time_limit,
+            "question": self._question_payload(session)
+        }
+    
+    @timing_recorder.timed("api.get_question")
+    def get_question(self, session: GameSession) -> Dict[str, Any]:
+        """현재 문제 조회"""
+        if session.is_game_finished():
+            raise ApiError(HTTPStatus.CONFLICT, "진행 중인 문제가 없습니다")
+        return self._question_payload(session)
+    
+    @staticmethod
+    def _question_payload(session: GameSession) -> Dict[str, Any]:
+        """현재 문제 응답 데이터 (정답 제외)"""
+        current_question = session.get_current_question()
+        current_num, total = session.get_game_progress()
+        remaining, _ = session.get_timer_state()
+        return {
+            "number": current_num,
+            "total": total,
+            "question": str(current_question),
+            "remaining_time": round(remaining, 3)
+        }
+    
+    @timing_recorder.timed("api.submit_answer")
+    def submit_answer(self, session: GameSession, data: Dict[str, Any]) -> Dict[str, Any]:
+        """답안 제출 후 다음 문제로 이동"""
+        if session.is_game_finished():
+            raise ApiError(HTTPStatus.CONFLICT, "진행 중인 문제가 없습니다")
+        
+        current_question = session.get_current_question()
+        is_correct, message, is_timeout = session.submit_answer(str(data.get("answer", "")))
+        session.next_question()
+        
+        finished = session.is_game_finished()
+        return {
+            "is_correct": is_correct,
+            "message": message,
+            "is_timeout": is_timeout,
+            "correct_answer": current_question.answer,
+            "finished": finished,
+            "next_question": None if finished else self._question_payload(session)
+        }
+    
+    async def get_results(self, session: GameSession) -> Dict[str, Any]:
+        """최종 결과 조회 및 저장 (같은 게임은 한 번만 저장)"""
+        if session.game_id is None or not session.is_game_finished():
+            raise ApiError(HTTPStatus.CONFLICT, "게임이 아직 끝나지 않았습니다")
+        
+        results = session.get_final_results()
+        save = functools.partial(
+            self.manager.save_game_result,
+            results['total_questions'],
+            results['correct_count'],
+            results['accuracy'],
+            results['operation_type'],
+            results['time_limit'],
+            results['total_time'],
+            game_id=results['game_id'],
+            replay=session.get_replay_record(),
+            questions=session.questions
+        )
+        results['saved'] = await asyncio.get_running_loop().run_in_executor(None, save)
+        return results
+
+# ASGI 애플리케이션
+app = GameApi()
+
+async def _run_asgi(asgi_app, scope: Dict[str, Any], body: bytes) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+    """요청 하나를 ASGI 애플리케이션으로 처리하고 응답 반환"""
+    response = {"status": HTTPStatus.INTERNAL_SERVER_ERROR, "headers": [], "body": []}
+    
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+    
+    await asgi_app(scope, receive, send)
+    return response["status"], response["headers"], b"".join(response["body"])
+
+async def _handle_connection(asgi_app, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """HTTP/1.1 연결 하나 처리 (keep-alive 지원)"""
+    server = writer.get_extra_info("sockname")
+    client = writer.get_extra_info("peername")
+    try:
+        while True:
+            try:
+                request_line = await asyncio.wait_for(reader.readline(), ApiConfig.KEEP_ALIVE_TIMEOUT)
+            except asyncio.TimeoutError:
+                break
+            if not request_line:
+                break
+            
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(b"HTTP/1.1 400 Bad Request\r\ncontent-length: 0\r\nconnection: close\r\n\r\n")
+                break
+            
+            # 헤더
+            headers = []
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers.append((name.strip().lower().encode("latin-1"), value.strip().encode("latin-1")))
+            header_map = dict(headers)
+            
+            # 본문
+            try:
+                content_length = int(header_map.get(b"content-length", b"0"))
+            except ValueError:
+                content_length = -1
+            if not 0 <= content_length <= ApiConfig.MAX_BODY_SIZE:
+                writer.write(b"HTTP/1.1 413 Payload Too Large\r\ncontent-length: 0\r\nconnection: close\r\n\r\n")
+                break
+            body = await reader.readexactly(content_length) if content_length else b""
+            
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": version.partition("/")[2] or "1.1",
+                "method": method.upper(),
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode("latin-1"),
+                "query_string": query.encode("latin-1"),
+                "root_path": "",
+                "headers": headers,
+                "server": server,
+                "client": client
+            }
+            status, response_headers, response_body = await _run_asgi(asgi_app, scope, body)
+            
+            keep_alive = version == "HTTP/1.1" and header_map.get(b"connection", b"").lower() != b"close"
+            head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}".encode("latin-1")]
+            head.extend(name + b": " + value for name, value in response_headers)
+            head.append(b"connection: keep-alive" if keep_alive else b"connection: close")
+            writer.write(b"\r\n".join(head) + b"\r\n\r\n" + response_body)
+            await writer.drain()
+            
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(asgi_app=app, host: str = ApiConfig.HOST, port: int = ApiConfig.PORT) -> asyncio.AbstractServer:
+    """
+    의존성 없는 asyncio HTTP 서버로 ASGI 애플리케이션 실행
+    
+    Args:
+        asgi_app: 실행할 ASGI 애플리케이션
+        host: 바인딩할 주소
+        port: 바인딩할 포트 (0이면 임의의 빈 포트)
+    
+    Returns:
+        asyncio.AbstractServer: 실행 중인 서버 (close()로 종료)
+    """
+    server = await asyncio.start_server(
+        functools.partial(_handle_connection, asgi_app), host, port
+    )
+    logger.info(f"게임 API 서버 시작: {server.sockets[0].getsockname()}")
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="두 자리 수 암산 게임 HTTP/JSON API")
+    parser.add_argument("--host", default=ApiConfig.HOST)
+    parser.add_argument("--port", type=int, default=ApiConfig.PORT)
+    args = parser.parse_args()
+    
+    async def run():
+        server = await serve(app, args.host, args.port)
+        async with server:
+            await server.serve_forever()
+    
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# assets.py - 정적 자원(CSS/JS) 캐시 및 주입 모듈
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from styles import get_custom_css, get_google_analytics
+
+# Google Analytics 스크립트 주소
+_GA_SCRIPT_SRC = re.search(r'<script async src="([^"]+)"></script>', get_google_analytics()).group(1)
+
+class Asset(NamedTuple):
+    """페이지 <head>에 넣을 자원 하나"""
+    name: str
+    kind: str       # "style", "script" (인라인), "script-src" (외부 파일)
+    content: str
+    digest: str
+
+def _strip_tags(html: str, tag: str) -> str:
+    """<tag>...</tag> 블록들의 내용만 이어서 반환 (속성이 있는 태그는 제외)"""
+    return "\n".join(re.findall(rf"<{tag}>(.*?)</{tag}>", html, flags=re.S))
+
+def minify_css(css: str) -> str:
+    """주석과 불필요한 공백 제거"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def minify_js(js: str) -> str:
+    """
+    줄 단위 주석, 들여쓰기, 빈 줄 제거
+    
+    자동 세미콜론 삽입에 영향을 주지 않도록 줄바꿈은 유지합니다.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def _make_asset(name: str, kind: str, content: str) -> Asset:
+    digest = hashlib.sha256(f"{kind}:{content}".encode("utf-8")).hexdigest()[:12]
+    return Asset(name, kind, content, digest)
+
+def build_assets() -> Tuple[Asset, ...]:
+    """styles 모듈의 CSS/JS를 축약하고 내용 해시를 붙인 자원 목록 생성"""
+    return (
+        _make_asset("custom-css", "style", minify_css(_strip_tags(get_custom_css(), "style"))),
+        _make_asset("gtag", "script-src", _GA_SCRIPT_SRC),
+        _make_asset("gtag-config", "script", minify_js(_strip_tags(get_google_analytics(), "script")))
+    )
+
+def build_asset_payload(assets: Tuple[Asset, ...]) -> List[Dict[str, Any]]:
+    """
+    주입 컴포넌트에 넘길 자원 목록 생성
+    
+    자원마다 "math-game-{이름}-{해시}" ID를 붙여 브라우저가 이미 있는 자원은
+    건너뛰므로, 내용이 바뀌면 새 해시로 다시 추가됩니다.
+    """
+    return [{"id": f"math-game-{a.name}-{a.digest}", "kind": a.kind, "content": a.content} for a in assets]
+
+# 앱 시작 시 한 번만 생성
+ASSETS = build_assets()
+ASSET_PAYLOAD = build_asset_payload(ASSETS)
+ASSET_BUNDLE_DIGEST = hashlib.sha256(
+    json.dumps(ASSET_PAYLOAD, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+).hexdigest()[:12]
+
+# 부모 페이지 <head>에 자원을 추가하고 추가한 묶음 해시를 돌려주는 컴포넌트
+_INJECTOR_KEY = "asset_injector"
+_asset_injector = components.declare_component(
+    "asset_injector",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "asset_injector")
+)
+
+def inject_assets():
+    """
+    CSS/JS 자원을 브라우저 세션마다 한 번만 주입
+    
+    브라우저가 자원을 추가한 뒤 묶음 해시를 돌려보내야 주입된 것으로 기록하므로,
+    재실행이 중간에 끊겨 컴포넌트가 실행되지 못했으면 다음 재실행에서 다시
+    보냅니다. 확인된 뒤에는 아무것도 보내지 않으며, 부모 페이지에 추가된 자원은
+    남아 있습니다. 새로고침하면 새 Streamlit 세션이 시작되어 다시 주입합니다.
+    """
+    if st.session_state.get('injected_asset_bundle') == ASSET_BUNDLE_DIGEST:
+        return
+    
+    if st.session_state.get(_INJECTOR_KEY) == ASSET_BUNDLE_DIGEST:
+        st.session_state.injected_asset_bundle = ASSET_BUNDLE_DIGEST
+        return
+    
+    _asset_injector(assets=ASSET_PAYLOAD, digest=ASSET_BUNDLE_DIGEST, key=_INJECTOR_KEY, default=None)
@@ -0,0 +1,483 @@
+# benchmarks.py - 성능 측정 스크립트
+#
+# 실행: python benchmarks.py
+
+import random
+import re
+import time
+import tracemalloc
+from typing import Callable, List
+
+from config import GameConfig, UIConfig, ErrorMessages
+import numpy as np
+
+from assets import ASSETS, ASSET_BUNDLE_DIGEST, ASSET_PAYLOAD
+from game_logic import GameSession, QuestionGenerator
+from instrumentation import TimingRecorder
+from stats_engine import categorize_accuracies
+from styles import get_custom_css, get_google_analytics
+from validation import input_validator
+
+def _time_call(func: Callable, repeat: int = 5) -> float:
+    """함수를 여러 번 실행해 가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _random_accuracies(count: int) -> List[float]:
+    """소수점 한 자리 정확도 목록 생성"""
+    return [round(random.uniform(0, 100), 1) for _ in range(count)]
+
+def _legacy_categorize(accuracy_list: List[float]) -> dict:
+    """기존 방식: 구간마다 목록을 한 번씩 순회"""
+    return {
+        'perfect': len([acc for acc in accuracy_list if acc == GameConfig.SCORE_PERFECT]),
+        'great': len([acc for acc in accuracy_list if GameConfig.SCORE_GREAT <= acc < GameConfig.SCORE_PERFECT]),
+        'good': len([acc for acc in accuracy_list if GameConfig.SCORE_GOOD <= acc < GameConfig.SCORE_GREAT]),
+        'okay': len([acc for acc in accuracy_list if GameConfig.SCORE_OKAY <= acc < GameConfig.SCORE_GOOD]),
+        'poor': len([acc for acc in accuracy_list if acc < GameConfig.SCORE_OKAY])
+    }
+
+def bench_categorize(sizes=(10_000, 100_000, 1_000_000)):
+    """성과 구간 분류: 기존 5회 순회 vs 단일 벡터 연산"""
+    print("## 성과 구간 분류 (_categorize_performance)")
+    print(f"{'행 수':>10} {'기존(ms)':>10} {'단일 패스(ms)':>14} {'속도 향상':>10}")
+    
+    for size in sizes:
+        accuracies = _random_accuracies(size)
+        assert _legacy_categorize(accuracies) == categorize_accuracies(accuracies)
+        
+        legacy = _time_call(lambda: _legacy_categorize(accuracies))
+        single_pass = _time_call(lambda: categorize_accuracies(accuracies))
+        print(f"{size:>10,} {legacy * 1000:>10.2f} {single_pass * 1000:>14.2f} {legacy / single_pass:>9.1f}x")
+    print()
+
+def _answer_pad_args(app) -> dict:
+    """AppTest 화면에서 답안 입력 컴포넌트에 넘긴 인자 찾기"""
+    import json
+    
+    def walk(node):
+        children = getattr(node, "children", None)
+        for child in children.values() if isinstance(children, dict) else ():
+            yield child
+            yield from walk(child)
+    
+    for element in walk(app._tree):
+        if getattr(element, "type", None) != "component_instance":
+            continue
+        instance = element.proto
+        if instance.component_name.endswith("answer_pad"):
+            return json.loads(instance.json_args)
+    raise RuntimeError("답안 입력 컴포넌트를 찾을 수 없습니다.")
+
+def bench_feedback_phase(answers: int = 5):
+    """
+    답안 하나당 서버 작업: 답안 제출 재실행 + 피드백 마감 확인 재실행
+    
+    AppTest로 실제 앱을 실행해 답안 제출부터 다음 문제 표시까지 스크립트
+    실행 시간만 더합니다. 피드백 단계는 FEEDBACK_POLL_INTERVAL마다 확인하며,
+    AppTest는 프래그먼트만 따로 실행할 수 없어 확인 1회를 전체 재실행으로
+    측정하므로 실제보다 크게 나옵니다. 확인 사이의 대기 동안에는 스크립트
+    스레드를 점유하지 않습니다.
+    """
+    print("## 답안 하나당 서버 작업 (handle_game_play → handle_feedback)")
+    
+    app = _start_app_game()
+    if app is None:
+        print("streamlit.testing을 불러올 수 없어 건너뜀")
+        print()
+        return
+    
+    submit_costs, poll_costs, poll_counts = [], [], []
+    for _ in range(answers):
+        app.session_state["answer_pad"] = {
+            'question_key': _answer_pad_args(app)['question_key'], 'answer': "0", 'timed_out': False
+        }
+        start = time.perf_counter()
+        app.run()
+        submit_costs.append(time.perf_counter() - start)
+        assert app.session_state.game_state == "feedback"
+        
+        polls = 0
+        while app.session_state.game_state == "feedback":
+            time.sleep(GameConfig.FEEDBACK_POLL_INTERVAL)
+            start = time.perf_counter()
+            app.run()
+            poll_costs.append(time.perf_counter() - start)
+            polls += 1
+        poll_counts.append(polls)
+    
+    submit_cost = sum(submit_costs) / len(submit_costs)
+    poll_cost = sum(poll_costs) / len(poll_costs)
+    polls = sum(poll_counts) / len(poll_counts)
+    print(f"{'답안 제출 실행(ms)':>18} {'마감 확인(회/답안)':>18} {'확인 1회(ms)':>14} {'답안당 합계(ms)':>16}")
+    print(f"{submit_cost * 1000:>18.2f} {polls:>18.1f} {poll_cost * 1000:>14.2f} "
+          f"{(submit_cost + polls * poll_cost) * 1000:>16.2f}")
+    print(f"(피드백 {GameConfig.FEEDBACK_DURATION}초 중 나머지 시간은 스레드를 점유하지 않음, 답안 {answers}개 평균)")
+    print()
+
+def _start_app_game():
+    """
+    AppTest로 게임 앱을 실행해 게임을 시작한 상태로 반환
+    
+    앱을 불러오면 sheets_manager의 전역 인스턴스가 만들어지므로, 현재
+    디렉터리에 결과 DB가 생기지 않도록 기본 저장 경로를 먼저 격리합니다.
+    
+    Returns:
+        AppTest 또는 None (streamlit.testing을 불러올 수 없는 경우)
+    """
+    import os
+    from loadtest import isolate_default_storage
+    
+    isolate_default_storage()
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return None
+    
+    app = AppTest.from_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"),
+                            default_timeout=30)
+    app.run()
+    [button for button in app.button if "게임 시작" in button.label][0].click().run()
+    return app
+
+def _timer_fragment_app():
+    """게임 화면 없이 render_live_timer 프래그먼트만 실행하는 앱 (AppTest.from_function용)"""
+    import streamlit as st
+    from main import GameStates, get_game_session, initialize_session_state, render_live_timer, start_new_game
+    
+    initialize_session_state()
+    if st.session_state.game_state != GameStates.PLAYING:
+        start_new_game(get_game_session())
+    render_live_timer()
+
+def bench_timer_tick(reruns: int = 20):
+    """
+    타이머 갱신 비용: 전체 스크립트 재실행 vs 타이머 프래그먼트만 있는 스크립트
+    
+    AppTest는 프래그먼트만 따로 다시 실행할 수 없으므로, 프래그먼트 쪽은
+    render_live_timer만 호출하는 작은 대용 스크립트를 전체 재실행한 값입니다.
+    스크립트 실행 비용과 st.* 호출은 양쪽 모두 포함됩니다.
+    """
+    print("## 타이머 갱신 1회당 서버 작업 (render_live_timer)")
+    
+    app = _start_app_game()
+    if app is None:
+        print("streamlit.testing을 불러올 수 없어 건너뜀")
+        print()
+        return
+    rerun_cost = _time_call(app.run, repeat=reruns)
+    
+    from streamlit.testing.v1 import AppTest
+    
+    fragment = AppTest.from_function(_timer_fragment_app, default_timeout=30)
+    fragment.run()
+    assert fragment.session_state.game_state == "playing"
+    fragment_cost = _time_call(fragment.run, repeat=reruns)
+    
+    print(f"{'main.py 전체 재실행(ms)':>24}: {rerun_cost * 1000:.2f}  (설정·CSS·헤더·문제·답안 입력 포함)")
+    print(f"{'프래그먼트 대용 스크립트(ms)':>24}: {fragment_cost * 1000:.2f}  "
+          f"(render_live_timer만 호출하는 스크립트의 전체 재실행)")
+    print()
+
+def bench_question_generation(sizes=(20, 1_000, 10_000)):
+    """문제 생성: 한 문제씩 생성 vs 배열 배치 생성"""
+    print("## 문제 세트 생성 (generate_question_set)")
+    print(f"{'문제 수':>8} {'한 문제씩(ms)':>14} {'배치(ms)':>10} {'배치·중복 없음(ms)':>20}")
+    
+    operation_type = UIConfig.OPERATION_TYPES[2]
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        legacy = _time_call(lambda: [QuestionGenerator.generate_question(operation_type) for _ in range(size)])
+        batch = _time_call(lambda: QuestionGenerator.generate_batch(operation_type, size, rng))
+        try:
+            unique = _time_call(lambda: QuestionGenerator.generate_batch(operation_type, size, rng, unique=True))
+            unique_text = f"{unique * 1000:.3f}"
+        except ValueError:
+            unique_text = "-"  # 중복 없는 조합 수 초과
+        print(f"{size:>8,} {legacy * 1000:>14.3f} {batch * 1000:>10.3f} {unique_text:>20}")
+    print()
+
+class _LegacyQuestion:
+    """기존 방식: 인스턴스마다 __dict__를 가진 문제 객체"""
+    
+    def __init__(self, num1: int, num2: int, operator: str, answer: int):
+        self.num1 = num1
+        self.num2 = num2
+        self.operator = operator
+        self.answer = answer
+        self.user_answer = None
+        self.is_correct = None
+        self.response_time = None
+
+def _measure_allocations(build: Callable) -> int:
+    """build 실행 후 남아 있는 할당 메모리(바이트) 반환"""
+    tracemalloc.start()
+    try:
+        snapshot_before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        allocated = tracemalloc.get_traced_memory()[0] - snapshot_before
+    finally:
+        tracemalloc.stop()
+    del kept
+    return allocated
+
+def bench_session_memory(sessions: int = 1_000):
+    """
+    게임 세션 메모리: 문제 객체 목록 vs 배열 기반 문제 세트
+    
+    문제 10개짜리 세트에서는 세션 전체 메모리의 대부분이 문제 이외의 부분
+    (취약 유형 모델, 난수 생성기 등)이므로 문제만의 크기와 세션 전체 크기를
+    나눠서 보고합니다.
+    """
+    print("## 게임 세션 메모리 (GameSession.questions)")
+    
+    operation_type = UIConfig.OPERATION_TYPES[2]
+    question_count = GameConfig.DEFAULT_QUESTIONS
+    
+    def build_sessions() -> List[GameSession]:
+        built = []
+        for _ in range(sessions):
+            session = GameSession()
+            session.start_game(operation_type, question_count, GameConfig.MAX_TIME_LIMIT)
+            built.append(session)
+        return built
+    
+    def build_legacy_sessions() -> List[GameSession]:
+        built = build_sessions()
+        for session in built:
+            session.questions = [
+                _LegacyQuestion(q.num1, q.num2, q.operator, q.answer) for q in session.questions
+            ]
+        return built
+    
+    def build_question_sets() -> list:
+        return [QuestionGenerator.generate_question_set(operation_type, question_count) for _ in range(sessions)]
+    
+    def build_legacy_question_lists() -> list:
+        return [
+            [_LegacyQuestion(q.num1, q.num2, q.operator, q.answer) for q in question_set]
+            for question_set in build_question_sets()
+        ]
+    
+    # 문제 컨테이너만 따로 측정 (세션 전체에는 취약 유형 모델 배열, random.Random 등이 포함)
+    legacy_questions = _measure_allocations(build_legacy_question_lists)
+    current_questions = _measure_allocations(build_question_sets)
+    legacy = _measure_allocations(build_legacy_sessions)
+    current = _measure_allocations(build_sessions)
+    
+    print(f"세션 {sessions:,}개, 문제 {question_count}개씩")
+    print(f"{'측정 대상':>14} {'객체 목록(B)':>14} {'문제 세트(B)':>14} {'절감':>8}")
+    print(f"{'문제만/세션':>14} {legacy_questions / sessions:>14,.0f} {current_questions / sessions:>14,.0f} "
+          f"{1 - current_questions / legacy_questions:>7.0%}")
+    print(f"{'세션 전체/세션':>14} {legacy / sessions:>14,.0f} {current / sessions:>14,.0f} "
+          f"{1 - current / legacy:>7.0%}")
+    print()
+
+def _legacy_validate_number_input(user_input: str, min_val: int = GameConfig.MIN_ANSWER,
+                                  max_val: int = GameConfig.MAX_ANSWER):
+    """기존 방식: strip 두 번, 컴파일하지 않은 정규표현식, 실패 시 메시지 포맷"""
+    if not user_input or not user_input.strip():
+        return False, ErrorMessages.INVALID_NUMBER
+    
+    cleaned_input = user_input.strip()
+    if not re.match(r'^-?\d+$', cleaned_input):
+        return False, ErrorMessages.INVALID_NUMBER
+    
+    try:
+        value = int(cleaned_input)
+        if min_val <= value <= max_val:
+            return True, value
+        else:
+            return False, ErrorMessages.NUMBER_OUT_OF_RANGE.format(min_val=min_val, max_val=max_val)
+    except ValueError:
+        return False, ErrorMessages.INVALID_NUMBER
+
+def bench_answer_validation(calls: int = 100_000):
+    """답안 검증: 기존 정규표현식 방식 vs 문자열 검사 빠른 경로"""
+    print("## 답안 검증 (validate_number_input)")
+    print(f"{'입력 종류':>10} {'기존(ns/회)':>12} {'빠른 경로(ns/회)':>16} {'속도 향상':>10}")
+    
+    cases = {
+        "정답 형식": ["57", "123", " 98 ", "-12", "0"],
+        "숫자 아님": ["abc", "", "   ", "1.5", "+7", "--3", "12a"],
+        "범위 초과": ["1000", "-5000", "123456789"]
+    }
+    for name, inputs in cases.items():
+        for user_input in inputs:
+            assert _legacy_validate_number_input(user_input) == input_validator.validate_number_input(user_input)
+        
+        repeated = inputs * (calls // len(inputs))
+        legacy = _time_call(lambda: [_legacy_validate_number_input(value) for value in repeated])
+        fast = _time_call(lambda: [input_validator.validate_number_input(value) for value in repeated])
+        print(f"{name:>10} {legacy / len(repeated) * 1e9:>12.0f} {fast / len(repeated) * 1e9:>16.0f} "
+              f"{legacy / fast:>9.1f}x")
+    print()
+
+def bench_instrumentation_overhead(calls: int = 200_000):
+    """계측 데코레이터/구간의 호출당 추가 비용 (꺼짐 vs 켜짐)"""
+    print("## 계측 오버헤드 (timing_recorder.timed / phase)")
+    print(f"{'상태':>6} {'데코레이터(ns/회)':>18} {'구간(ns/회)':>12}")
+    
+    def noop():
+        pass
+    
+    baseline = _time_call(lambda: [noop() for _ in range(calls)])
+    for enabled in (False, True):
+        recorder = TimingRecorder(enabled=enabled)
+        wrapped = recorder.timed("noop")(noop)
+        
+        def run_phase():
+            for _ in range(calls):
+                with recorder.phase("noop"):
+                    pass
+        
+        decorated = _time_call(lambda: [wrapped() for _ in range(calls)])
+        phased = _time_call(run_phase)
+        label = "켜짐" if enabled else "꺼짐"
+        print(f"{label:>6} {(decorated - baseline) / calls * 1e9:>18.0f} {phased / calls * 1e9:>12.0f}")
+    print()
+
+def bench_asset_payload(questions: int = GameConfig.DEFAULT_QUESTIONS, reruns_per_question: int = 3):
+    """게임 한 판 동안 브라우저로 보내는 CSS/JS 바이트 (재실행마다 전송 vs 세션당 한 번 주입)"""
+    print("## 정적 자원 전송량 (setup_page)")
+    print(f"{'자원':>12} {'원본(B)':>9} {'축약(B)':>9}")
+    originals = {
+        'custom-css': get_custom_css(),
+        'gtag-config': get_google_analytics()
+    }
+    for asset in ASSETS:
+        print(f"{asset.name:>12} {len(originals.get(asset.name, asset.content).encode()):>9,} {len(asset.content.encode()):>9,}")
+    
+    # 기존: 재실행마다 CSS/GA 마크다운 전송
+    page_bytes = len(get_custom_css().encode()) + len(get_google_analytics().encode())
+    reruns = questions * reruns_per_question
+    legacy = reruns * page_bytes
+    # 현재: 주입 확인 전까지의 재실행(보통 1회)에만 자원 목록을 컴포넌트 인자로 전송
+    # (컴포넌트 index.html은 정적 파일로 한 번 받아 브라우저 캐시에 보관)
+    import json
+    import os
+    
+    injected = len(json.dumps({'assets': ASSET_PAYLOAD, 'digest': ASSET_BUNDLE_DIGEST}).encode())
+    injector_html = os.path.getsize(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                 "frontend", "asset_injector", "index.html"))
+    print(f"게임 1판 (문제 {questions}개, 재실행 {reruns}회): 기존 {legacy / 1024:,.1f}KB, "
+          f"세션당 한 번 주입 {injected / 1024:,.1f}KB ({legacy / injected:.0f}배 감소, "
+          f"컴포넌트 파일 {injector_html / 1024:,.1f}KB 별도)")
+    print()
+
+def bench_answer_pad(questions: int = GameConfig.DEFAULT_QUESTIONS):
+    """
+    답안 입력 컴포넌트: 게임 한 판 동안 만들어지는 iframe 수와 문제당 전송량
+    
+    브라우저 렌더링 시간은 측정하지 않습니다. 헤드리스 브라우저 없이는 기존
+    방식과 비교할 기준값을 얻을 수 없으므로, 여기서는 iframe 수(계산값)와
+    문제당 인자 크기만 보고합니다.
+    """
+    import json
+    import os
+    
+    print("## 답안 입력 컴포넌트 (render_answer_pad)")
+    frontend = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "answer_pad", "index.html")
+    html_bytes = os.path.getsize(frontend)
+    args_bytes = len(json.dumps({
+        'question_key': f"{'0' * 32}:{questions}",
+        'remaining': float(GameConfig.MAX_TIME_LIMIT),
+        'time_limit': GameConfig.MAX_TIME_LIMIT,
+        'disabled': False
+    }).encode())
+    
+    # iframe 수는 측정값이 아니라 코드 구조에서 계산한 값
+    # 기존: 문제마다 입력 폼 + 포커스 스크립트 iframe 2개를 새로 만들고, 각 iframe이
+    # MutationObserver와 재시도 타이머를 따로 실행
+    # 현재: key로 식별되는 컴포넌트 하나를 게임 내내 재사용 (Streamlit 1.50 이상)
+    print(f"{'방식':>14} {'iframe 생성(개/판, 계산값)':>24} {'문제당 전송(B)':>16}")
+    print(f"{'문제마다 iframe':>14} {questions * 2:>24,} {'스크립트 전체':>16}")
+    print(f"{'단일 컴포넌트':>14} {1:>24,} {args_bytes:>16,}  (index.html {html_bytes:,}B는 게임당 한 번)")
+    print("(브라우저 렌더링 시간은 측정하지 않음)")
+    print()
+
+def bench_client_game(games: int = 2_000):
+    """게임 한 판의 서버 채점 작업: 문제마다 제출 vs 브라우저 진행 후 한 번에 제출"""
+    print("## 게임 1판 서버 채점 (submit_answer x N vs submit_client_results)")
+    question_count = GameConfig.DEFAULT_QUESTIONS
+    session = GameSession()
+    
+    def per_question():
+        for _ in range(games):
+            session.start_game(UIConfig.OPERATION_TYPES[2], question_count, GameConfig.MAX_TIME_LIMIT)
+            while not session.is_game_finished():
+                session.submit_answer(str(session.get_current_question().answer))
+                session.next_question()
+    
+    def client_batch():
+        for _ in range(games):
+            batch = session.start_client_game(UIConfig.OPERATION_TYPES[2], question_count, GameConfig.MAX_TIME_LIMIT)
+            answers = [str(num1 + num2 if operator == "+" else num1 - num2) for num1, operator, num2 in batch['questions']]
+            session.submit_client_results(batch['seed'], answers, [0.0] * question_count)
+    
+    legacy = _time_call(per_question, repeat=3) / games
+    batched = _time_call(client_batch, repeat=3) / games
+    print(f"{'방식':>14} {'서버 재실행(회/판)':>18} {'채점 작업(ms/판)':>16}")
+    print(f"{'문제마다 제출':>14} {question_count:>18} {legacy * 1000:>16.3f}")
+    print(f"{'브라우저 진행':>14} {1:>18} {batched * 1000:>16.3f}")
+    print()
+
+def bench_event_log(games: int = 10_000):
+    """문제별 이벤트 로그: 게임당 기록 비용과 이벤트당 저장 크기 (Parquet vs JSON 행)"""
+    import json
+    import os
+    import tempfile
+    
+    from event_log import QuestionEventLog, load_events
+    
+    print("## 문제별 이벤트 로그 (QuestionEventLog)")
+    session = GameSession(seed=0)
+    finished = []
+    for _ in range(games):
+        session.start_game(UIConfig.OPERATION_TYPES[2], GameConfig.DEFAULT_QUESTIONS, GameConfig.MAX_TIME_LIMIT)
+        session.grade_answers([str(question.answer) for question in session.questions],
+                              [session.question_start_time + 1.5] * len(session.questions))
+        finished.append((session.game_id, session.start_time, session.operation_type, session.questions))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        log = QuestionEventLog(directory)
+        start = time.perf_counter()
+        for index in range(games):
+            log.append_game(*finished[index])
+        log.close()
+        elapsed = time.perf_counter() - start
+        
+        events = load_events(directory)
+        parquet_bytes = sum(entry.stat().st_size for entry in os.scandir(directory))
+    
+    json_bytes = sum(len(json.dumps(row, default=str)) + 1 for row in events.head(10_000).to_dict("records"))
+    json_bytes = json_bytes / min(len(events), 10_000) * len(events)
+    print(f"{'이벤트 수':>10} {'게임당 기록(us)':>16} {'Parquet(B/행)':>14} {'JSON(B/행)':>12}")
+    print(f"{len(events):>10,} {elapsed / games * 1e6:>16.1f} {parquet_bytes / len(events):>14.2f} "
+          f"{json_bytes / len(events):>12.1f}")
+    print()
+
+def main():
+    from loadtest import isolate_default_storage
+    
+    # 앱을 불러오는 측정이 현재 디렉터리에 결과 DB를 만들지 않도록 격리
+    isolate_default_storage()
+    random.seed(0)
+    bench_categorize()
+    bench_feedback_phase()
+    bench_timer_tick()
+    bench_question_generation()
+    bench_session_memory()
+    bench_answer_validation()
+    bench_instrumentation_overhead()
+    bench_asset_payload()
+    bench_answer_pad()
+    bench_client_game()
+    bench_event_log()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 # config.py - 게임 설정 및 상수 관리
 
+import os
+
 class GameConfig:
     """게임 설정 관련 상수"""
     # 문제 수 설정
@@ -12,6 +14,16 @@ class GameConfig:
     MAX_TIME_LIMIT = 10
     DEFAULT_TIME_LIMIT = 5
     
+    # 타이머 갱신 주기 (초)
+    TIMER_TICK_INTERVAL = 0.5
+    
+    # 답안 제출 후 결과 메시지를 보여주는 시간 (초)
+    FEEDBACK_DURATION = 1.0
+    FEEDBACK_POLL_INTERVAL = 0.25
+    
+    # 브라우저 진행 모드: 보고된 응답 시간과 서버 경과 시간 비교 시 허용 오차 (초)
+    CLIENT_SUBMIT_GRACE = 5.0
+    
     # 숫자 범위 설정
     MIN_NUMBER = 10
     MAX_NUMBER = 99
@@ -26,6 +38,56 @@ class GameConfig:
     MIN_ANSWER = -999
     MAX_ANSWER = 999
 
+class DifficultyConfig:
+    """난이도별 문제 생성 관련 설정"""
+    # 난이도 등급 (받아올림/받아내림 횟수에 자릿수 합 기준을 더해 결정)
+    LEVEL_EASY = 0
+    LEVEL_NORMAL = 1
+    LEVEL_HARD = 2
+    
+    # 두 피연산자의 자릿수 합이 이 값 이상이면 한 등급 올림
+    HIGH_DIGIT_SUM = 20
+    
+    # 난이도 프로필: 등급별 출제 비율 (쉬움, 보통, 어려움)
+    PROFILES = {
+        "쉬움": (0.7, 0.3, 0.0),
+        "보통": (0.2, 0.6, 0.2),
+        "어려움": (0.0, 0.3, 0.7)
+    }
+
+class AdaptiveConfig:
+    """사용자별 취약 유형 학습 관련 설정"""
+    # 메인 화면 게임에서 취약 유형 위주 출제 사용 여부
+    ENABLED = True
+    
+    # 새 답안 결과를 취약도에 반영하는 비율 (지수 이동 평균)
+    LEARNING_RATE = 0.3
+    
+    # 취약도 1인 유형의 추가 출제 가중치
+    BIAS_STRENGTH = 4.0
+
+class SessionConfig:
+    """게임 세션 레지스트리 관련 설정"""
+    # 마지막 접근 후 세션을 보관하는 시간 (초)
+    IDLE_TTL = 1800
+    
+    # 한 프로세스가 보관하는 최대 세션 수
+    MAX_SESSIONS = 1000
+
+class ApiConfig:
+    """HTTP/JSON 게임 API 관련 설정"""
+    HOST = "127.0.0.1"
+    PORT = 8000
+    
+    # API로 동시에 진행할 수 있는 최대 게임 세션 수
+    MAX_SESSIONS = 10000
+    
+    # 요청 본문 최대 크기 (바이트)
+    MAX_BODY_SIZE = 4096
+    
+    # 연결을 유지한 채 다음 요청을 기다리는 시간 (초)
+    KEEP_ALIVE_TIMEOUT = 15.0
+
 class UIConfig:
     """UI 관련 상수"""
     # 페이지 설정
@@ -65,6 +127,64 @@ class SheetsConfig:
         "날짜", "시간", "총 문제수", "정답수", 
         "정답률", "연산타입", "제한시간", "소요시간"
     ]
+    
+    # 결과를 저장할 워크시트 이름
+    WORKSHEET_NAME = "Sheet1"
+    
+    # 연결 풀 설정
+    POOL_SIZE = 4                  # 동시에 사용할 최대 클라이언트 수
+    POOL_ACQUIRE_TIMEOUT = 30.0    # 연결 대기 최대 시간 (초)
+    HEALTH_CHECK_INTERVAL = 300    # 연결 상태 확인 주기 (초)
+    
+    # 데이터가 들어있는 마지막 컬럼 (A1 표기)
+    LAST_COLUMN = "H"
+    
+    # 백그라운드 저장 설정
+    WRITE_BATCH_SIZE = 20          # 한 번에 저장할 최대 행 수
+    WRITE_FLUSH_INTERVAL = 2.0     # 저장 주기 (초)
+    WRITE_MAX_RETRIES = 5          # API 오류 시 최대 재시도 횟수
+    WRITE_RETRY_BASE_DELAY = 1.0   # 재시도 대기 시간 기준 (초, 매번 2배)
+    WRITE_MAX_BACKOFF = 300.0      # 저장이 연속으로 실패할 때 다음 시도까지 최대 대기 시간 (초)
+
+class StorageConfig:
+    """결과 저장소 백엔드 설정"""
+    # 사용할 백엔드: "sheets" (Google Sheets), "sqlite", "memory"
+    # secrets의 STORAGE_BACKEND 값으로 변경 가능
+    BACKEND = "sheets"
+    
+    # SQLite 백엔드 데이터베이스 파일 경로
+    SQLITE_DB_PATH = "game_results_backend.db"
+
+class LocalStoreConfig:
+    """로컬 결과 저장소 관련 설정"""
+    # SQLite 데이터베이스 파일 경로
+    DB_PATH = "game_results.db"
+
+class EventLogConfig:
+    """문제별 답안 이벤트 로그 관련 설정"""
+    # Parquet 파일을 저장할 디렉터리
+    DIRECTORY = "question_events"
+    
+    # 버퍼가 이 행 수를 넘거나 이 시간(초)이 지나면 새 파일로 기록
+    FLUSH_ROWS = 5000
+    FLUSH_INTERVAL = 60.0
+    
+    # 기록한 작은 파일이 이 개수만큼 모이면 하나로 합침
+    COMPACT_MIN_FILES = 60
+    
+    # Parquet 압축 방식
+    COMPRESSION = "zstd"
+
+class InstrumentationConfig:
+    """구간별 실행 시간 계측 관련 설정"""
+    # 환경 변수 GAME_INSTRUMENTATION=1 이면 계측 (기본값: 사용 안 함)
+    ENABLED = os.environ.get("GAME_INSTRUMENTATION", "0") == "1"
+    
+    # 최근 측정값을 보관하는 링 버퍼 크기
+    BUFFER_SIZE = 4096
+    
+    # Prometheus 메트릭 이름
+    METRIC_NAME = "math_game_phase_seconds"
 
 class ErrorMessages:
     """에러 메시지 상수"""
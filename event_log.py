@@ -0,0 +1,272 @@
+# event_log.py - 문제별 답안 이벤트 로그 (Parquet 열 지향 저장)
+
+import atexit
+import glob
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import EventLogConfig
+from game_logic import OPERATOR_SYMBOLS, QuestionSet
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 로그 스키마 (문제 하나당 한 행)
+EVENT_SCHEMA = pa.schema([
+    ("game_id", pa.dictionary(pa.int32(), pa.string())),
+    ("started_at", pa.timestamp("ms")),
+    ("operation_type", pa.dictionary(pa.int8(), pa.string())),
+    ("question_index", pa.int8()),
+    ("num1", pa.int8()),
+    ("num2", pa.int8()),
+    ("operator", pa.dictionary(pa.int8(), pa.string())),
+    ("user_answer", pa.int16()),
+    ("is_correct", pa.bool_()),
+    ("response_time", pa.float32())
+])
+
+# 아직 쓰는 중인 파일의 확장자 (다 쓴 파일만 .parquet으로 바뀜)
+_OPEN_SUFFIX = ".parquet.open"
+
+class QuestionEventLog:
+    """
+    문제별 답안 이벤트를 메모리에 모았다가 Parquet 파일로 한 번에 쓰는 로그
+    
+    게임마다 QuestionSet의 열 배열을 그대로 버퍼에 넣고, 버퍼가 flush_rows를
+    넘거나 flush_interval이 지나면 버퍼 전체를 완결된 Parquet 파일 하나로
+    씁니다. 파일은 .open 이름으로 쓴 뒤 .parquet으로 바꾸므로, 기록된 이벤트는
+    바로 읽을 수 있고 프로세스가 강제 종료되어도 버퍼에 남은 것만 잃습니다.
+    작은 파일이 compact_min_files개 모이면 하나로 합칩니다.
+    
+    시간 기준 기록은 백그라운드 스레드가 맡으므로 새 게임이 없어도 버퍼가
+    flush_interval 이상 남지 않으며, 남은 이벤트는 프로세스 종료 시 기록됩니다.
+    """
+    
+    def __init__(self, directory: str = EventLogConfig.DIRECTORY,
+                 flush_rows: int = EventLogConfig.FLUSH_ROWS,
+                 flush_interval: float = EventLogConfig.FLUSH_INTERVAL,
+                 compact_min_files: int = EventLogConfig.COMPACT_MIN_FILES):
+        self.directory = directory
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.compact_min_files = compact_min_files
+        
+        self._buffer: List[Dict[str, np.ndarray]] = []
+        self._buffered_rows = 0
+        self._last_flush = time.time()
+        
+        # 이 프로세스가 기록한 뒤 아직 합치지 않은 파일들
+        self._small_files: List[str] = []
+        self._file_seq = itertools.count(1)
+        
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def append_game(self, game_id: str, started_at: float, operation_type: str,
+                    questions: QuestionSet) -> int:
+        """
+        게임 한 판의 문제별 이벤트를 버퍼에 추가
+        
+        Args:
+            game_id: 게임 고유 ID
+            started_at: 게임 시작 시각 (time.time() 기준)
+            operation_type: 연산 타입
+            questions: 답안이 기록된 QuestionSet
+        
+        Returns:
+            int: 추가한 이벤트 수
+        """
+        count = len(questions)
+        if count == 0:
+            return 0
+        
+        chunk = {
+            'game_id': np.full(count, game_id, dtype=object),
+            'started_at': np.full(count, int(started_at * 1000), dtype=np.int64),
+            'operation_type': np.full(count, operation_type, dtype=object),
+            'question_index': np.arange(count, dtype=np.int8),
+            'num1': questions.num1.astype(np.int8),
+            'num2': questions.num2.astype(np.int8),
+            'op_code': questions.op_codes.astype(np.int8),
+            'user_answer': questions.user_answers.copy(),
+            'correctness': questions.correctness.copy(),
+            'response_time': questions.response_times.copy()
+        }
+        
+        self._ensure_started()
+        with self._lock:
+            self._buffer.append(chunk)
+            self._buffered_rows += count
+            if self._buffered_rows >= self.flush_rows:
+                self._flush_locked()
+        return count
+    
+    def _ensure_started(self):
+        """시간 기준 기록 스레드가 없으면 시작"""
+        if self._thread is not None:
+            return
+        
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+    
+    def _run(self):
+        """버퍼가 flush_interval 이상 남지 않도록 주기적으로 기록"""
+        while not self._stop_event.wait(max(0.0, self._last_flush + self.flush_interval - time.time())):
+            with self._lock:
+                if time.time() - self._last_flush >= self.flush_interval:
+                    self._flush_locked()
+            if len(self._small_files) >= self.compact_min_files:
+                self.compact()
+    
+    def flush(self) -> int:
+        """
+        버퍼의 이벤트를 파일에 기록
+        
+        Returns:
+            int: 기록한 이벤트 수
+        """
+        with self._lock:
+            return self._flush_locked()
+    
+    def compact(self) -> int:
+        """
+        이 프로세스가 기록한 작은 파일들을 새 파일 하나로 합침
+        
+        합치는 동안에도 게임 기록이 막히지 않도록 잠금 없이 읽고 씁니다. 새
+        파일을 .parquet으로 바꾼 뒤 원래 파일을 지우므로, 그 사이에 읽으면 같은
+        이벤트가 두 번 보일 수 있지만 이벤트를 잃지는 않습니다.
+        
+        Returns:
+            int: 합친 파일 수 (합칠 파일이 두 개 미만이면 0)
+        """
+        with self._lock:
+            sources, self._small_files = self._small_files, []
+        if len(sources) < 2:
+            with self._lock:
+                self._small_files = sources + self._small_files
+            return 0
+        
+        try:
+            path = self._write_file(pa.concat_tables([pq.read_table(source) for source in sources]))
+        except Exception as e:
+            with self._lock:
+                self._small_files = sources + self._small_files
+            logger.error(f"답안 이벤트 파일 {len(sources)}개 합치기 실패: {str(e)}")
+            return 0
+        
+        for source in sources:
+            os.remove(source)
+        logger.info(f"답안 이벤트 파일 {len(sources)}개를 합침: {path}")
+        return len(sources)
+    
+    def close(self):
+        """기록 스레드를 멈추고 버퍼를 기록한 뒤 작은 파일들을 합침"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+        self.compact()
+    
+    @staticmethod
+    def _to_table(buffer: List[Dict[str, np.ndarray]]) -> pa.Table:
+        """버퍼의 열 배열들을 이어 붙여 Arrow 테이블로 변환"""
+        columns = {name: np.concatenate([chunk[name] for chunk in buffer]) for name in buffer[0]}
+        correctness = columns['correctness']
+        return pa.table({
+            'game_id': pa.array(columns['game_id'], pa.string()).dictionary_encode(),
+            'started_at': pa.array(columns['started_at'], pa.timestamp("ms")),
+            'operation_type': pa.array(columns['operation_type'], pa.string()).dictionary_encode(),
+            'question_index': pa.array(columns['question_index']),
+            'num1': pa.array(columns['num1']),
+            'num2': pa.array(columns['num2']),
+            'operator': pa.DictionaryArray.from_arrays(
+                pa.array(columns['op_code']), pa.array(OPERATOR_SYMBOLS, pa.string())
+            ),
+            'user_answer': pa.array(columns['user_answer'],
+                                    mask=columns['user_answer'] == QuestionSet.NO_ANSWER),
+            'is_correct': pa.array(correctness == 1, mask=correctness == QuestionSet.UNGRADED),
+            'response_time': pa.array(columns['response_time'], from_pandas=True)
+        }).cast(EVENT_SCHEMA)
+    
+    def _flush_locked(self) -> int:
+        self._last_flush = time.time()
+        if not self._buffer:
+            return 0
+        
+        buffer, rows = self._buffer, self._buffered_rows
+        self._buffer, self._buffered_rows = [], 0
+        
+        try:
+            path = self._write_file(self._to_table(buffer))
+        except Exception as e:
+            # 기록에 실패한 이벤트는 버퍼로 되돌려 다음에 다시 시도
+            self._buffer = buffer + self._buffer
+            self._buffered_rows += rows
+            logger.error(f"답안 이벤트 {rows}건 기록 실패: {str(e)}")
+            return 0
+        
+        self._small_files.append(path)
+        logger.info(f"답안 이벤트 {rows}건 기록: {path}")
+        return rows
+    
+    def _write_file(self, table: pa.Table) -> str:
+        """테이블을 .open 파일에 다 쓴 뒤 .parquet 이름으로 바꾸고 경로 반환"""
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"events-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(self._file_seq):04d}"
+        open_path = os.path.join(self.directory, name + _OPEN_SUFFIX)
+        pq.write_table(table, open_path, compression=EventLogConfig.COMPRESSION)
+        
+        path = open_path[:-len(".open")]
+        os.replace(open_path, path)
+        return path
+
+def load_events(directory: str = EventLogConfig.DIRECTORY,
+                columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    기록이 끝난 파일의 이벤트를 모두 읽기
+    
+    Args:
+        directory: 이벤트 로그 디렉터리
+        columns: 읽을 열 이름 (None이면 전체)
+    
+    Returns:
+        pd.DataFrame: 문제별 이벤트 (파일이 없으면 빈 DataFrame)
+    """
+    paths = sorted(glob.glob(os.path.join(directory, "*.parquet")))
+    if not paths:
+        return pd.DataFrame(columns=columns or EVENT_SCHEMA.names)
+    return pd.read_parquet(paths, columns=columns)
+
+def summarize_pairs(events: pd.DataFrame, min_attempts: int = 5) -> pd.DataFrame:
+    """
+    피연산자 조합별 정답률과 응답 시간 요약 (정답률이 낮고 느린 순)
+    
+    Args:
+        events: load_events()의 결과
+        min_attempts: 요약에 포함할 최소 채점 횟수
+    
+    Returns:
+        pd.DataFrame: (operator, num1, num2)별 attempts, accuracy, median_time, p95_time
+    """
+    graded = events.dropna(subset=["is_correct"]).astype({"is_correct": bool})
+    grouped = graded.groupby(["operator", "num1", "num2"], observed=True)
+    summary = grouped.agg(
+        attempts=("is_correct", "size"),
+        accuracy=("is_correct", "mean"),
+        median_time=("response_time", "median"),
+        p95_time=("response_time", lambda times: times.quantile(0.95))
+    )
+    summary = summary[summary["attempts"] >= min_attempts]
+    return summary.sort_values(["accuracy", "median_time"], ascending=[True, False])
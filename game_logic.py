@@ -1,14 +1,79 @@
 # game_logic.py - 게임 로직 관리 모듈
 
+import itertools
 import random
+import threading
 import time
-from typing import Tuple, List
-from config import GameConfig, UIConfig, ErrorMessages
+import uuid
+from collections import OrderedDict
+from typing import Tuple, Optional, Sequence
+import numpy as np
+from config import GameConfig, UIConfig, SessionConfig, DifficultyConfig, ErrorMessages
 from validation import input_validator, game_validator
+from adaptive import AdaptiveModel
+
+# 연산자 코드 (배치 생성 시 배열에 저장되는 값)
+OP_ADD = 0
+OP_SUB = 1
+OPERATOR_SYMBOLS = ('+', '-')
+
+# 미리 계산한 피연산자 조합 (두 자리 수 90 x 90 = 8,100개)
+_OPERANDS = np.arange(GameConfig.MIN_NUMBER, GameConfig.MAX_NUMBER + 1, dtype=np.int16)
+_PAIR_NUM1, _PAIR_NUM2 = (grid.ravel() for grid in np.meshgrid(_OPERANDS, _OPERANDS, indexing='ij'))
+
+# 뺄셈은 결과가 음수가 되지 않는 조합만 사용 (num1 >= num2)
+_SUB_PAIR_MASK = _PAIR_NUM1 >= _PAIR_NUM2
+_SUB_PAIR_NUM1 = _PAIR_NUM1[_SUB_PAIR_MASK]
+_SUB_PAIR_NUM2 = _PAIR_NUM2[_SUB_PAIR_MASK]
+
+# 게임 시드 비트 수 (브라우저의 JavaScript Number로도 정확히 표현되는 크기)
+SEED_BITS = 53
+
+def _build_difficulty_index(op_code: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    연산자별 8,100개 피연산자 조합을 난이도 등급 순으로 정렬한 인덱스 생성
+    
+    등급은 받아올림(덧셈)/받아내림(뺄셈) 횟수에 두 피연산자의 자릿수 합이
+    HIGH_DIGIT_SUM 이상이면 1을 더한 값입니다 (최대 LEVEL_HARD).
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (num1, num2, 등급별 시작 위치)
+            등급 L의 조합은 [offsets[L], offsets[L + 1]) 구간에 있습니다.
+    """
+    num1, num2 = _PAIR_NUM1, _PAIR_NUM2
+    if op_code == OP_SUB:
+        # 한 문제씩 생성할 때와 같이 큰 수를 앞으로
+        num1, num2 = np.maximum(num1, num2), np.minimum(num1, num2)
+    
+    tens1, ones1 = np.divmod(num1, 10)
+    tens2, ones2 = np.divmod(num2, 10)
+    if op_code == OP_ADD:
+        carry_ones = (ones1 + ones2 >= 10).astype(np.int16)
+        regroups = carry_ones + (tens1 + tens2 + carry_ones >= 10)
+    else:
+        regroups = (ones1 < ones2).astype(np.int16)
+    
+    digit_sum = tens1 + ones1 + tens2 + ones2
+    levels = np.minimum(regroups + (digit_sum >= DifficultyConfig.HIGH_DIGIT_SUM), DifficultyConfig.LEVEL_HARD)
+    
+    order = np.argsort(levels, kind='stable')
+    offsets = np.searchsorted(levels[order], np.arange(DifficultyConfig.LEVEL_HARD + 2))
+    return num1[order], num2[order], offsets
+
+# 연산자 코드별 난이도 인덱스
+_DIFFICULTY_INDEX = {op_code: _build_difficulty_index(op_code) for op_code in (OP_ADD, OP_SUB)}
+
+# 난이도 인덱스의 각 조합이 속한 취약 유형 (일의 자리 조합 0~99)
+_PATTERN_CELLS = {
+    op_code: (index_num1 % 10) * 10 + index_num2 % 10
+    for op_code, (index_num1, index_num2, _) in _DIFFICULTY_INDEX.items()
+}
 
 class Question:
     """개별 문제를 나타내는 클래스"""
     
+    __slots__ = ('num1', 'num2', 'operator', 'answer', 'user_answer', 'is_correct', 'response_time')
+    
     def __init__(self, num1: int, num2: int, operator: str, answer: int):
         self.num1 = num1
         self.num2 = num2
@@ -36,22 +101,153 @@ class Question:
         else:
             return False, f"틀림! 정답은 {self.answer}입니다."
 
+class QuestionSet:
+    """
+    배열로 저장된 문제 세트 (struct-of-arrays)
+    
+    피연산자, 연산자 코드, 정답과 함께 사용자 답안, 정답 여부, 응답 시간을
+    문제별 객체 대신 필드별로 연속된 NumPy 배열에 보관합니다. 인덱스로 접근하면
+    현재 상태가 담긴 Question 객체를 만들어 반환합니다.
+    """
+    
+    __slots__ = ('_fields', 'response_times')
+    
+    # 아직 답하지 않았거나 숫자가 아닌 답안을 나타내는 값
+    NO_ANSWER = np.iinfo(np.int16).min
+    UNGRADED = -1
+    
+    # 정수 필드는 한 번의 할당으로 (필드 수 x 문제 수) 배열에 행 단위로 저장
+    _NUM1, _NUM2, _OP_CODE, _ANSWER, _USER_ANSWER, _CORRECTNESS = range(6)
+    
+    def __init__(self, num1: np.ndarray, num2: np.ndarray, op_codes: np.ndarray, answers: np.ndarray):
+        count = len(answers)
+        self._fields = np.empty((6, count), dtype=np.int16)
+        self._fields[self._NUM1] = num1
+        self._fields[self._NUM2] = num2
+        self._fields[self._OP_CODE] = op_codes
+        self._fields[self._ANSWER] = answers
+        self._fields[self._USER_ANSWER] = self.NO_ANSWER
+        self._fields[self._CORRECTNESS] = self.UNGRADED
+        self.response_times = np.full(count, np.nan, dtype=np.float32)
+    
+    @property
+    def num1(self) -> np.ndarray:
+        return self._fields[self._NUM1]
+    
+    @property
+    def num2(self) -> np.ndarray:
+        return self._fields[self._NUM2]
+    
+    @property
+    def op_codes(self) -> np.ndarray:
+        return self._fields[self._OP_CODE]
+    
+    @property
+    def answers(self) -> np.ndarray:
+        return self._fields[self._ANSWER]
+    
+    @property
+    def user_answers(self) -> np.ndarray:
+        return self._fields[self._USER_ANSWER]
+    
+    @property
+    def correctness(self) -> np.ndarray:
+        return self._fields[self._CORRECTNESS]
+    
+    @classmethod
+    def empty(cls) -> "QuestionSet":
+        """빈 문제 세트 생성"""
+        empty_array = np.empty(0, dtype=np.int8)
+        return cls(empty_array, empty_array, empty_array, empty_array)
+    
+    def __len__(self) -> int:
+        return self._fields.shape[1]
+    
+    def __getitem__(self, index: int) -> Question:
+        if not -len(self) <= index < len(self):
+            raise IndexError("문제 번호가 범위를 벗어났습니다.")
+        num1, num2, op_code, answer, user_answer, correctness = self._fields[:, index].tolist()
+        question = Question(num1, num2, OPERATOR_SYMBOLS[op_code], answer)
+        
+        if user_answer != self.NO_ANSWER:
+            question.user_answer = user_answer
+        if correctness != self.UNGRADED:
+            question.is_correct = bool(correctness)
+        if not np.isnan(self.response_times[index]):
+            question.response_time = float(self.response_times[index])
+        return question
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def record_answer(self, index: int, user_answer: Optional[int],
+                      is_correct: Optional[bool], response_time: float):
+        """
+        문제의 답안 기록
+        
+        Args:
+            index: 문제 번호 (0부터)
+            user_answer: 사용자 답안 (숫자가 아니면 None)
+            is_correct: 정답 여부 (채점할 수 없으면 None)
+            response_time: 응답 시간 (초)
+        """
+        if user_answer is not None:
+            self._fields[self._USER_ANSWER, index] = user_answer
+        if is_correct is not None:
+            self._fields[self._CORRECTNESS, index] = int(is_correct)
+        self.response_times[index] = response_time
+    
+    def grade_answers(self, start: int, user_answers: np.ndarray,
+                      response_times: np.ndarray, time_limit: float) -> np.ndarray:
+        """
+        연속된 문제들의 답안을 한 번에 채점해 기록
+        
+        제한 시간을 넘긴 답안은 오답(시간 초과)으로, 숫자가 아닌 답안(NO_ANSWER)은
+        채점하지 않은 상태로 기록합니다.
+        
+        Args:
+            start: 첫 문제 번호 (0부터)
+            user_answers: 사용자 답안 배열 (숫자가 아니면 NO_ANSWER)
+            response_times: 응답 시간 배열 (초)
+            time_limit: 제한 시간 (초)
+        
+        Returns:
+            np.ndarray: 문제별 정답 여부 (bool 배열)
+        """
+        end = start + len(user_answers)
+        if end > len(self):
+            raise ValueError("채점할 답안 수가 남은 문제 수를 초과했습니다.")
+        
+        timed_out = response_times > time_limit
+        answered = (user_answers != self.NO_ANSWER) & ~timed_out
+        is_correct = answered & (user_answers == self.answers[start:end])
+        
+        self._fields[self._USER_ANSWER, start:end] = np.where(answered, user_answers, self.NO_ANSWER)
+        self._fields[self._CORRECTNESS, start:end] = np.where(answered | timed_out, is_correct, self.UNGRADED)
+        self.response_times[start:end] = np.where(timed_out, time_limit, response_times)
+        return is_correct
+
 class QuestionGenerator:
     """문제 생성 클래스"""
     
     @staticmethod
-    def generate_question(operation_type: str) -> Question:
+    def generate_question(operation_type: str, rng: Optional[random.Random] = None) -> Question:
         """
         연산 타입에 따른 문제 생성
         
         Args:
             operation_type: 연산 타입 ("덧셈", "뺄셈", "랜덤 (덧셈+뺄셈)")
-            
+            rng: 사용할 난수 생성기 (없으면 random 모듈 전역 상태 사용)
+        
         Returns:
             Question: 생성된 문제 객체
         """
-        num1 = random.randint(GameConfig.MIN_NUMBER, GameConfig.MAX_NUMBER)
-        num2 = random.randint(GameConfig.MIN_NUMBER, GameConfig.MAX_NUMBER)
+        if rng is None:
+            rng = random  # 모듈 함수도 randint/choice를 같은 방식으로 제공
+        
+        num1 = rng.randint(GameConfig.MIN_NUMBER, GameConfig.MAX_NUMBER)
+        num2 = rng.randint(GameConfig.MIN_NUMBER, GameConfig.MAX_NUMBER)
         
         if operation_type == "덧셈":
             operator = "+"
@@ -63,7 +259,7 @@ class QuestionGenerator:
             operator = "-"
             answer = num1 - num2
         else:  # 랜덤
-            if random.choice([True, False]):
+            if rng.choice([True, False]):
                 operator = "+"
                 answer = num1 + num2
             else:
@@ -75,37 +271,177 @@ class QuestionGenerator:
         return Question(num1, num2, operator, answer)
     
     @staticmethod
-    def generate_question_set(operation_type: str, count: int) -> List[Question]:
+    def generate_question_set(operation_type: str, count: int,
+                              difficulty: Optional[str] = None,
+                              seed: Optional[int] = None) -> QuestionSet:
         """
         문제 세트 생성
         
         Args:
             operation_type: 연산 타입
             count: 생성할 문제 수
-            
+            difficulty: 난이도 프로필 이름 (None이면 난이도 구분 없음)
+            seed: 난수 시드 (같은 시드와 설정이면 같은 문제 세트 생성)
+        
+        Returns:
+            QuestionSet: 생성된 문제 세트 (Question 시퀀스로 사용)
+        """
+        rng = np.random.default_rng(seed) if seed is not None else None
+        return QuestionGenerator.generate_batch(operation_type, count, rng=rng, difficulty=difficulty)
+    
+    @staticmethod
+    def generate_batch(operation_type: str, count: int,
+                       rng: Optional[np.random.Generator] = None,
+                       unique: bool = False,
+                       difficulty: Optional[str] = None,
+                       adaptive_model: Optional[AdaptiveModel] = None) -> QuestionSet:
+        """
+        문제 여러 개를 배열 연산으로 한 번에 생성
+        
+        Args:
+            operation_type: 연산 타입
+            count: 생성할 문제 수
+            rng: 사용할 난수 생성기 (같은 시드면 같은 문제 생성)
+            unique: True이면 연산자별 피연산자 조합을 중복 없이 선택
+            difficulty: 난이도 프로필 이름 (DifficultyConfig.PROFILES의 키)
+            adaptive_model: 사용자 취약 유형 모델 (취약 유형 위주로 출제)
+        
         Returns:
-            List[Question]: 생성된 문제들의 리스트
+            QuestionSet: 생성된 문제 세트
         """
-        return [QuestionGenerator.generate_question(operation_type) for _ in range(count)]
+        if rng is None:
+            rng = np.random.default_rng()
+        
+        # 연산자 코드 결정
+        if operation_type == "덧셈":
+            op_codes = np.full(count, OP_ADD, dtype=np.int8)
+        elif operation_type == "뺄셈":
+            op_codes = np.full(count, OP_SUB, dtype=np.int8)
+        else:  # 랜덤
+            op_codes = rng.integers(OP_ADD, OP_SUB + 1, size=count, dtype=np.int8)
+        
+        if (difficulty is not None) + (adaptive_model is not None) + unique > 1:
+            raise ValueError("난이도 프로필, 취약 유형 출제, 중복 없는 생성은 함께 사용할 수 없습니다.")
+        
+        if difficulty is not None:
+            num1, num2 = QuestionGenerator._sample_by_difficulty(op_codes, difficulty, rng)
+        elif adaptive_model is not None:
+            num1, num2 = QuestionGenerator._sample_adaptive(op_codes, adaptive_model, rng)
+        elif unique:
+            num1, num2 = QuestionGenerator._sample_unique_pairs(op_codes, rng)
+        else:
+            pair_indices = rng.integers(0, len(_PAIR_NUM1), size=count)
+            num1 = _PAIR_NUM1[pair_indices]
+            num2 = _PAIR_NUM2[pair_indices]
+            
+            # 뺄셈은 결과가 음수가 되지 않도록 큰 수를 앞으로
+            is_sub = op_codes == OP_SUB
+            num1, num2 = (np.where(is_sub, np.maximum(num1, num2), num1),
+                          np.where(is_sub, np.minimum(num1, num2), num2))
+        
+        answers = np.where(op_codes == OP_ADD, num1 + num2, num1 - num2)
+        return QuestionSet(num1, num2, op_codes, answers)
+    
+    @staticmethod
+    def _sample_unique_pairs(op_codes: np.ndarray, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """연산자별 피연산자 조합 공간에서 중복 없이 선택"""
+        num1 = np.empty(len(op_codes), dtype=np.int16)
+        num2 = np.empty(len(op_codes), dtype=np.int16)
+        
+        for op_code, pair_num1, pair_num2 in ((OP_ADD, _PAIR_NUM1, _PAIR_NUM2),
+                                              (OP_SUB, _SUB_PAIR_NUM1, _SUB_PAIR_NUM2)):
+            positions = np.flatnonzero(op_codes == op_code)
+            if len(positions) > len(pair_num1):
+                raise ValueError(f"중복 없이 만들 수 있는 문제 수({len(pair_num1)}개)를 초과했습니다.")
+            
+            pair_indices = rng.choice(len(pair_num1), size=len(positions), replace=False)
+            num1[positions] = pair_num1[pair_indices]
+            num2[positions] = pair_num2[pair_indices]
+        
+        return num1, num2
+    
+    @staticmethod
+    def _sample_by_difficulty(op_codes: np.ndarray, difficulty: str,
+                              rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """난이도 프로필의 등급별 비율에 따라 난이도 인덱스에서 선택 (문제당 O(1))"""
+        if difficulty not in DifficultyConfig.PROFILES:
+            raise ValueError(f"알 수 없는 난이도입니다: {difficulty}")
+        
+        weights = np.asarray(DifficultyConfig.PROFILES[difficulty], dtype=np.float64)
+        levels = rng.choice(len(weights), size=len(op_codes), p=weights / weights.sum())
+        
+        num1 = np.empty(len(op_codes), dtype=np.int16)
+        num2 = np.empty(len(op_codes), dtype=np.int16)
+        for op_code, (index_num1, index_num2, offsets) in _DIFFICULTY_INDEX.items():
+            positions = np.flatnonzero(op_codes == op_code)
+            op_levels = levels[positions]
+            
+            # 등급 구간 안에서 균등하게 선택
+            starts = offsets[op_levels]
+            sizes = offsets[op_levels + 1] - starts
+            pair_indices = starts + (rng.random(len(positions)) * sizes).astype(np.int64)
+            num1[positions] = index_num1[pair_indices]
+            num2[positions] = index_num2[pair_indices]
+        
+        return num1, num2
+    
+    @staticmethod
+    def _sample_adaptive(op_codes: np.ndarray, adaptive_model: AdaptiveModel,
+                         rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """사용자 취약 유형의 가중치에 비례해 피연산자 조합 선택"""
+        num1 = np.empty(len(op_codes), dtype=np.int16)
+        num2 = np.empty(len(op_codes), dtype=np.int16)
+        for op_code, (index_num1, index_num2, _) in _DIFFICULTY_INDEX.items():
+            positions = np.flatnonzero(op_codes == op_code)
+            if len(positions) == 0:
+                continue
+            
+            pair_weights = adaptive_model.pattern_weights(op_code).ravel()[_PATTERN_CELLS[op_code]]
+            pair_indices = rng.choice(len(index_num1), size=len(positions), p=pair_weights / pair_weights.sum())
+            num1[positions] = index_num1[pair_indices]
+            num2[positions] = index_num2[pair_indices]
+        
+        return num1, num2
 
 class GameSession:
-    """게임 세션을 관리하는 클래스"""
+    """
+    게임 세션을 관리하는 클래스
+    
+    세션마다 자체 난수 생성기를 두고 게임마다 새 시드를 뽑아 문제 세트를
+    생성합니다. 시드는 결과와 함께 기록되므로 시드와 답안만으로 게임을 다시
+    만들 수 있습니다 (replay 참고).
+    """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: 세션 난수 생성기 시드 (None이면 운영체제 난수로 초기화)
+        """
+        # 취약 유형 모델과 난수 생성기는 게임이 바뀌어도 유지
+        self.adaptive_model = AdaptiveModel()
+        self.rng = random.Random(seed)
         self.reset()
     
     def reset(self):
         """게임 세션 초기화"""
-        self.questions: List[Question] = []
+        self.questions: QuestionSet = QuestionSet.empty()
+        self.game_id = None
         self.current_question_index = 0
         self.correct_count = 0
         self.start_time = None
         self.question_start_time = None
         self.operation_type = ""
+        self.difficulty = None
         self.time_limit = GameConfig.DEFAULT_TIME_LIMIT
+        self.seed = None
+        self.is_adaptive = False
+        self.adaptive_snapshot = None
+        self.is_client_game = False
         self.is_active = False
     
-    def start_game(self, operation_type: str, question_count: int, time_limit: int):
+    def start_game(self, operation_type: str, question_count: int, time_limit: int,
+                   difficulty: Optional[str] = None, adaptive: bool = False,
+                   seed: Optional[int] = None, adaptive_snapshot: Optional[str] = None):
         """
         게임 시작
         
@@ -113,22 +449,132 @@ class GameSession:
             operation_type: 연산 타입
             question_count: 문제 수
             time_limit: 제한 시간
+            difficulty: 난이도 프로필 이름 (None이면 난이도 구분 없음)
+            adaptive: True이면 이전 게임에서 틀리거나 느렸던 유형 위주로 출제
+                (난이도 프로필을 지정하면 사용하지 않음)
+            seed: 문제 세트 난수 시드 (None이면 세션 난수 생성기에서 새로 뽑음)
+            adaptive_snapshot: 재생할 게임의 취약 유형 모델 스냅샷 (지정하면 세션
+                모델 대신 이 상태로 출제)
         """
         # 설정 검증
         is_valid, error_msg = game_validator.validate_game_settings(
-            question_count, time_limit, operation_type
+            question_count, time_limit, operation_type, difficulty
         )
         if not is_valid:
             raise ValueError(error_msg)
         
         self.reset()
-        self.questions = QuestionGenerator.generate_question_set(operation_type, question_count)
+        if seed is None:
+            seed = self.rng.getrandbits(SEED_BITS)
+        
+        if adaptive_snapshot is not None:
+            adaptive_model = AdaptiveModel.from_snapshot(adaptive_snapshot)
+            self.is_adaptive = difficulty is None
+        else:
+            adaptive_model = self.adaptive_model
+            self.is_adaptive = adaptive and difficulty is None and adaptive_model.has_data
+        if self.is_adaptive:
+            # 게임 중 모델이 갱신되므로 출제 시점의 상태를 재생 기록용으로 보관
+            self.adaptive_snapshot = adaptive_model.snapshot()
+            self.questions = QuestionGenerator.generate_batch(
+                operation_type, question_count, rng=np.random.default_rng(seed),
+                adaptive_model=adaptive_model
+            )
+        else:
+            self.questions = QuestionGenerator.generate_question_set(operation_type, question_count, difficulty, seed)
+        self.seed = seed
+        self.game_id = uuid.uuid4().hex
         self.operation_type = operation_type
+        self.difficulty = difficulty
         self.time_limit = time_limit
         self.start_time = time.time()
         self.question_start_time = time.time()
         self.is_active = True
     
+    def start_client_game(self, operation_type: str, question_count: int, time_limit: int,
+                          difficulty: Optional[str] = None) -> dict:
+        """
+        브라우저에서 게임 전체를 진행하는 모드로 시작
+        
+        문제 세트를 새 시드로 생성해 한 번에 내려보내고, 게임이 끝나면
+        submit_client_results()로 답안을 한 번에 받아 채점합니다.
+        
+        Returns:
+            dict: get_client_batch()와 같은 문제 배치
+        """
+        self.start_game(operation_type, question_count, time_limit, difficulty)
+        self.is_client_game = True
+        return self.get_client_batch()
+    
+    def get_client_batch(self) -> dict:
+        """
+        브라우저 게임 진행용 문제 배치
+        
+        Returns:
+            dict: {game_id, seed, time_limit, questions: [[num1, 연산자, num2], ...]}
+        """
+        return {
+            'game_id': self.game_id,
+            'seed': self.seed,
+            'time_limit': self.time_limit,
+            'questions': [
+                [num1, OPERATOR_SYMBOLS[op_code], num2]
+                for num1, op_code, num2 in zip(self.questions.num1.tolist(),
+                                               self.questions.op_codes.tolist(),
+                                               self.questions.num2.tolist())
+            ]
+        }
+    
+    def submit_client_results(self, seed: int, user_inputs: Sequence[Optional[str]],
+                              response_times: Sequence[Optional[float]]) -> int:
+        """
+        브라우저에서 진행한 게임의 답안을 한 번에 채점
+        
+        시드가 이번 게임에 내려보낸 배치와 같은지, 답안 수가 문제 수와 같은지,
+        보고된 응답 시간이 서버에서 흐른 시간과 맞는지 확인합니다. 답하지 않은
+        문제(None)와 제한 시간을 넘긴 답안은 시간 초과(오답)로 기록합니다.
+        
+        Args:
+            seed: 브라우저가 받은 문제 배치의 시드
+            user_inputs: 문제별 사용자 입력 (답하지 않았으면 None)
+            response_times: 문제별 응답 시간 (초, 답하지 않았으면 None)
+        
+        Returns:
+            int: 정답 수
+        """
+        if not self.is_active or not self.is_client_game or self.current_question_index != 0:
+            raise ValueError("브라우저에서 진행 중인 게임이 없습니다.")
+        
+        # 브라우저가 보낸 JSON 값이므로 채점 전에 형식부터 확인
+        if not isinstance(user_inputs, (list, tuple)) or not isinstance(response_times, (list, tuple)):
+            raise ValueError("제출 형식이 올바르지 않습니다.")
+        if not all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+                   for value in response_times):
+            raise ValueError("응답 시간이 올바르지 않습니다.")
+        
+        if isinstance(seed, bool) or seed != self.seed:
+            raise ValueError("문제 배치가 이번 게임과 다릅니다.")
+        if not len(user_inputs) == len(response_times) == len(self.questions):
+            raise ValueError("답안 수가 문제 수와 다릅니다.")
+        
+        times = np.array([np.inf if value is None else value for value in response_times], dtype=np.float64)
+        if np.isnan(times).any() or (times < 0).any():
+            raise ValueError("응답 시간이 올바르지 않습니다.")
+        
+        # 보고된 시간 합은 서버에서 흐른 시간을 넘을 수 없고, 배치는 모든 문제의
+        # 제한 시간과 피드백 시간이 지나기 전에 제출되어야 함
+        elapsed = time.time() - self.start_time
+        reported = float(np.minimum(times, self.time_limit).sum())
+        deadline = len(self.questions) * (self.time_limit + GameConfig.FEEDBACK_DURATION)
+        if reported > elapsed + GameConfig.CLIENT_SUBMIT_GRACE:
+            raise ValueError("응답 시간이 실제 경과 시간보다 깁니다.")
+        if elapsed > deadline + GameConfig.CLIENT_SUBMIT_GRACE:
+            raise ValueError("제출 기한이 지났습니다.")
+        
+        correct_count = self._grade(["" if value is None else value for value in user_inputs], times)
+        self.question_start_time = time.time()
+        return correct_count
+    
     def get_current_question(self) -> Question:
         """현재 문제 반환"""
         if not self.is_active or self.current_question_index >= len(self.questions):
@@ -146,19 +592,30 @@ class GameSession:
         )
         return is_valid, elapsed
     
+    def get_timer_state(self) -> Tuple[float, bool]:
+        """
+        현재 문제의 타이머 상태 반환
+        
+        Returns:
+            Tuple[float, bool]: (남은 시간, 시간 초과 여부)
+        """
+        is_time_valid, elapsed = self.check_time_limit()
+        return max(0.0, self.time_limit - elapsed), not is_time_valid
+    
     def submit_answer(self, user_input: str) -> Tuple[bool, str, bool]:
         """
         답안 제출 및 검증
         
         Args:
             user_input: 사용자 입력
-            
+        
         Returns:
             Tuple[bool, str, bool]: (정답여부, 메시지, 시간초과여부)
         """
         # 시간 초과 확인
         is_time_valid, elapsed_time = self.check_time_limit()
         if not is_time_valid:
+            self.record_timeout()
             return False, ErrorMessages.TIME_UP, True
         
         # 현재 문제 가져오기
@@ -166,15 +623,98 @@ class GameSession:
         if not current_question:
             return False, "유효하지 않은 문제입니다.", False
         
-        # 답안 검증
+        # 답안 검증 후 문제 세트에 기록
         is_correct, message = current_question.check_answer(user_input)
-        current_question.response_time = elapsed_time
+        self.questions.record_answer(
+            self.current_question_index, current_question.user_answer,
+            current_question.is_correct, elapsed_time
+        )
+        if current_question.is_correct is not None:
+            self.adaptive_model.record(
+                OPERATOR_SYMBOLS.index(current_question.operator),
+                current_question.num1, current_question.num2,
+                is_correct, elapsed_time / self.time_limit
+            )
         
         if is_correct:
             self.correct_count += 1
         
         return is_correct, message, False
     
+    def grade_answers(self, user_inputs: Sequence[str], timestamps: Sequence[float]) -> int:
+        """
+        현재 문제부터 여러 답안을 한 번에 채점 (기록된 게임 재생, 부하 테스트용)
+        
+        각 문제의 응답 시간은 이전 답안 제출 시각(첫 문제는 현재 문제 시작
+        시각)부터 해당 답안 제출 시각까지로 계산합니다.
+        
+        Args:
+            user_inputs: 사용자 입력 문자열 목록
+            timestamps: 답안별 제출 시각 (time.time() 기준)
+        
+        Returns:
+            int: 이번에 채점한 답안 중 정답 수
+        """
+        if not self.is_active:
+            raise ValueError("진행 중인 게임이 없습니다.")
+        if len(user_inputs) != len(timestamps):
+            raise ValueError("답안 수와 제출 시각 수가 다릅니다.")
+        if not user_inputs:
+            return 0
+        
+        submitted_at = np.asarray(timestamps, dtype=np.float64)
+        response_times = np.diff(submitted_at, prepend=self.question_start_time)
+        if (response_times < 0).any():
+            raise ValueError("제출 시각은 시간 순서대로 주어져야 합니다.")
+        
+        correct_count = self._grade(user_inputs, response_times)
+        self.question_start_time = float(submitted_at[-1])
+        return correct_count
+    
+    def _grade(self, user_inputs: Sequence[str], response_times: np.ndarray) -> int:
+        """현재 문제부터 답안과 응답 시간을 채점·기록하고 다음 위치로 이동"""
+        if not all(isinstance(value, str) for value in user_inputs):
+            raise ValueError("답안 형식이 올바르지 않습니다.")
+        
+        # 입력 검증은 문자열마다, 채점은 배열 연산으로 한 번에
+        user_answers = np.fromiter(
+            (value if is_valid else QuestionSet.NO_ANSWER
+             for is_valid, value in map(input_validator.validate_number_input, user_inputs)),
+            dtype=np.int16, count=len(user_inputs)
+        )
+        
+        start = self.current_question_index
+        is_correct = self.questions.grade_answers(start, user_answers, response_times, self.time_limit)
+        
+        # 취약 유형 모델 갱신 (채점된 답안만)
+        end = start + len(is_correct)
+        graded = (self.questions.correctness[start:end] != QuestionSet.UNGRADED).tolist()
+        for record in zip(self.questions.op_codes[start:end].tolist(), self.questions.num1[start:end].tolist(),
+                          self.questions.num2[start:end].tolist(), is_correct.tolist(),
+                          (self.questions.response_times[start:end] / self.time_limit).tolist(), graded):
+            if record[-1]:
+                self.adaptive_model.record(*record[:-1])
+        
+        correct_count = int(is_correct.sum())
+        self.correct_count += correct_count
+        self.current_question_index += len(is_correct)
+        if self.current_question_index >= len(self.questions):
+            self.is_active = False
+        
+        return correct_count
+    
+    def record_timeout(self):
+        """현재 문제를 시간 초과로 기록"""
+        current_question = self.get_current_question()
+        if not current_question or current_question.response_time is not None:
+            return
+        
+        self.questions.record_answer(self.current_question_index, None, False, float(self.time_limit))
+        self.adaptive_model.record(
+            OPERATOR_SYMBOLS.index(current_question.operator),
+            current_question.num1, current_question.num2, False, 1.0
+        )
+    
     def next_question(self):
         """다음 문제로 이동"""
         self.current_question_index += 1
@@ -192,10 +732,16 @@ class GameSession:
         return self.current_question_index + 1, len(self.questions)
     
     def get_current_accuracy(self) -> float:
-        """현재까지의 정확도 계산"""
-        if self.current_question_index == 0:
+        """
+        현재까지의 정확도 계산
+        
+        피드백 단계에서는 현재 문제의 답안도 이미 채점되어 있으므로, 문제 번호가
+        아니라 응답 시간이 기록된(답안 또는 시간 초과) 문제 수로 나눕니다.
+        """
+        answered = int(np.count_nonzero(~np.isnan(self.questions.response_times)))
+        if answered == 0:
             return 0.0
-        return (self.correct_count / self.current_question_index) * 100
+        return (self.correct_count / answered) * 100
     
     def get_final_results(self) -> dict:
         """최종 결과 반환"""
@@ -207,13 +753,151 @@ class GameSession:
             accuracy = 0.0
         
         return {
+            'game_id': self.game_id,
             'total_questions': len(self.questions),
             'correct_count': self.correct_count,
             'accuracy': accuracy,
             'total_time': total_time,
             'operation_type': self.operation_type,
-            'time_limit': self.time_limit
+            'time_limit': self.time_limit,
+            'seed': self.seed
+        }
+    
+    def get_replay_record(self) -> dict:
+        """
+        게임 재생 기록 (문제 없이 설정, 시드, 답안만 포함)
+        
+        Returns:
+            dict: {operation_type, question_count, time_limit, difficulty, seed,
+                adaptive, adaptive_snapshot, answers, response_times} (취약 유형
+                출제가 아니면 스냅샷은 None, 숫자가 아닌 답안은 None, 시간 초과나
+                답하지 않은 문제는 응답 시간도 None)
+        """
+        answers = self.questions.user_answers.tolist()
+        timed_out = (self.questions.user_answers == QuestionSet.NO_ANSWER) & (self.questions.correctness == 0)
+        response_times = np.where(timed_out, np.nan, self.questions.response_times).tolist()
+        return {
+            'operation_type': self.operation_type,
+            'question_count': len(self.questions),
+            'time_limit': self.time_limit,
+            'difficulty': self.difficulty,
+            'seed': self.seed,
+            'adaptive': self.is_adaptive,
+            'adaptive_snapshot': self.adaptive_snapshot,
+            'answers': [None if answer == QuestionSet.NO_ANSWER else answer for answer in answers],
+            'response_times': [None if seconds != seconds else seconds for seconds in response_times]
         }
+    
+    def replay(self, record: dict) -> dict:
+        """
+        재생 기록으로 게임을 다시 진행하고 최종 결과 반환
+        
+        같은 시드로 같은 문제 세트를 만든 뒤 기록된 답안과 응답 시간으로
+        채점합니다. 취약 유형 출제(adaptive) 게임은 기록에 담긴 출제 시점의
+        취약 유형 모델 스냅샷으로 문제를 만들므로 새 세션에서도 재생할 수 있습니다.
+        
+        Args:
+            record: get_replay_record()가 반환한 기록
+        
+        Returns:
+            dict: get_final_results()와 같은 형식의 결과
+        """
+        adaptive_snapshot = record.get('adaptive_snapshot')
+        if record.get('adaptive', False) and adaptive_snapshot is None:
+            raise ValueError("취약 유형 모델 스냅샷이 없는 기록은 같은 문제를 만들 수 없습니다.")
+        self.start_game(record['operation_type'], record['question_count'], record['time_limit'],
+                        record.get('difficulty'), seed=record['seed'],
+                        adaptive_snapshot=adaptive_snapshot)
+        
+        # 응답 시간이 없는 문제는 시간 초과로 채점
+        response_times = np.array(
+            [np.inf if seconds is None else seconds for seconds in record['response_times']], dtype=np.float64
+        )
+        user_inputs = ["" if answer is None else str(answer) for answer in record['answers']]
+        self._grade(user_inputs, response_times)
+        return self.get_final_results()
+
+class SessionRegistry:
+    """Streamlit 세션 ID별 게임 세션 저장소
+    
+    마지막 접근 시각 순으로 세션을 보관하며, IDLE_TTL 동안 사용되지 않은
+    세션과 MAX_SESSIONS를 초과한 가장 오래된 세션을 제거합니다. 용량 초과로
+    제거할 때는 게임이 진행 중인 세션을 건너뜁니다.
+    """
+    
+    def __init__(self, idle_ttl: float = SessionConfig.IDLE_TTL,
+                 max_sessions: int = SessionConfig.MAX_SESSIONS):
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Tuple[GameSession, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, session_id: str, seed: Optional[int] = None) -> GameSession:
+        """
+        세션 ID에 해당하는 게임 세션 반환 (없으면 생성)
+        
+        Args:
+            session_id: Streamlit 세션 ID
+            seed: 새로 만드는 세션의 난수 생성기 시드 (None이면 운영체제 난수)
+        
+        Returns:
+            GameSession: 해당 사용자의 게임 세션
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            session = entry[0] if entry else GameSession(seed)
+            self._sessions[session_id] = (session, now)
+            self._evict(now, session_id)
+        return session
+    
+    def find(self, session_id: str) -> Optional[GameSession]:
+        """
+        세션 ID에 해당하는 게임 세션 반환 (없으면 생성하지 않고 None)
+        
+        Args:
+            session_id: 세션 ID
+        
+        Returns:
+            Optional[GameSession]: 해당 게임 세션 또는 None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            if entry is None:
+                return None
+            self._sessions[session_id] = (entry[0], now)
+            self._evict(now, session_id)
+        return entry[0]
+    
+    def remove(self, session_id: str):
+        """세션 제거"""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def _evict(self, now: float, current_id: str):
+        """만료되었거나 용량을 초과한 세션 정리 (잠금 상태에서 호출)"""
+        # 유휴 시간을 넘긴 세션은 진행 중이어도 제거 (가장 오래된 것부터)
+        while self._sessions:
+            oldest_id, (_, last_access) = next(iter(self._sessions.items()))
+            if now - last_access > self.idle_ttl:
+                del self._sessions[oldest_id]
+            else:
+                break
+        
+        # 용량 초과 시 방금 사용한 세션과 게임 중인 세션을 제외하고 오래된 순으로 제거
+        excess = len(self._sessions) - self.max_sessions
+        if excess > 0:
+            idle_ids = list(itertools.islice(
+                (session_id for session_id, (session, _) in self._sessions.items()
+                 if session_id != current_id and not session.is_active),
+                excess
+            ))
+            for session_id in idle_ids:
+                del self._sessions[session_id]
 
 class PerformanceEvaluator:
     """성과 평가 클래스"""
@@ -225,7 +909,7 @@ class PerformanceEvaluator:
         
         Args:
             accuracy: 정확도 (%)
-            
+        
         Returns:
             Tuple[str, str, str]: (아이콘, 메시지, 스타일)
         """
@@ -252,6 +936,6 @@ class PerformanceEvaluator:
         else:
             return "📚 더 연습하면 더욱 좋아질 거예요!"
 
-# 전역 게임 세션 인스턴스
-game_session = GameSession()
+# 전역 게임 세션 레지스트리
+session_registry = SessionRegistry()
 performance_evaluator = PerformanceEvaluator()
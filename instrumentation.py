@@ -0,0 +1,159 @@
+# instrumentation.py - 구간별 실행 시간 계측 모듈
+
+import functools
+import threading
+import time
+from collections import deque, defaultdict
+from typing import Optional, Dict, List, Tuple, Callable
+
+import numpy as np
+
+from config import InstrumentationConfig
+
+# 요약에 포함할 백분위 (Prometheus quantile 라벨)
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+class _NullPhase:
+    """계측을 사용하지 않을 때 쓰는 아무 일도 하지 않는 구간"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class _Phase:
+    """with 블록 실행 시간을 기록하는 구간"""
+    
+    __slots__ = ('_recorder', '_name', '_start')
+    
+    def __init__(self, recorder: "TimingRecorder", name: str):
+        self._recorder = recorder
+        self._name = name
+    
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._recorder.record(self._name, time.perf_counter() - self._start)
+        return False
+
+class TimingRecorder:
+    """
+    구간별 실행 시간을 링 버퍼에 기록하는 클래스
+    
+    최근 BUFFER_SIZE개 측정값은 백분위 계산에, 구간별 누적 횟수와 합계는
+    Prometheus 요약(_count, _sum)에 사용합니다. 계측을 끄면 데코레이터는
+    플래그 확인 한 번, 구간은 공유 객체 반환만 하므로 부담이 거의 없습니다.
+    """
+    
+    def __init__(self, enabled: bool = InstrumentationConfig.ENABLED,
+                 buffer_size: int = InstrumentationConfig.BUFFER_SIZE):
+        self.enabled = enabled
+        self._samples: "deque[Tuple[str, float]]" = deque(maxlen=buffer_size)
+        self._totals: Dict[str, List[float]] = {}  # 구간 이름 -> [횟수, 합계]
+        self._lock = threading.Lock()
+    
+    def record(self, name: str, seconds: float):
+        """측정값 하나 기록"""
+        self._samples.append((name, seconds))
+        with self._lock:
+            totals = self._totals.get(name)
+            if totals is None:
+                self._totals[name] = [1, seconds]
+            else:
+                totals[0] += 1
+                totals[1] += seconds
+    
+    def phase(self, name: str):
+        """
+        with 블록의 실행 시간을 name 구간으로 기록하는 컨텍스트 매니저
+        
+        사용 예: with timing_recorder.phase("css"): ...
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+    
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """
+        함수 실행 시간을 기록하는 데코레이터
+        
+        Args:
+            name: 구간 이름 (없으면 함수의 qualified name)
+        """
+        def decorator(func: Callable) -> Callable:
+            label = name or func.__qualname__
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(label, time.perf_counter() - start)
+            
+            return wrapper
+        return decorator
+    
+    def reset(self):
+        """기록된 측정값 모두 삭제"""
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        구간별 측정 요약
+        
+        Returns:
+            Dict[str, Dict[str, float]]: 구간 이름 -> {count, total, p50, p95, p99, max}
+                (count, total은 누적값, 백분위와 max는 링 버퍼의 최근 측정값 기준)
+        """
+        with self._lock:
+            samples = list(self._samples)
+            totals = {name: tuple(values) for name, values in self._totals.items()}
+        
+        recent: Dict[str, List[float]] = defaultdict(list)
+        for name, seconds in samples:
+            recent[name].append(seconds)
+        
+        result = {}
+        for name, (count, total) in sorted(totals.items()):
+            values = np.asarray(recent.get(name) or [0.0])
+            quantiles = np.quantile(values, SUMMARY_QUANTILES)
+            result[name] = {
+                'count': count,
+                'total': total,
+                'p50': float(quantiles[0]),
+                'p95': float(quantiles[1]),
+                'p99': float(quantiles[2]),
+                'max': float(values.max())
+            }
+        return result
+    
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식의 요약 메트릭 반환"""
+        metric = InstrumentationConfig.METRIC_NAME
+        lines = [
+            f"# HELP {metric} 구간별 실행 시간 (초)",
+            f"# TYPE {metric} summary"
+        ]
+        for name, stats in self.summary().items():
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            for quantile, key in zip(SUMMARY_QUANTILES, ('p50', 'p95', 'p99')):
+                lines.append(f'{metric}{{phase="{label}",quantile="{quantile}"}} {stats[key]:.6f}')
+            lines.append(f'{metric}_sum{{phase="{label}"}} {stats["total"]:.6f}')
+            lines.append(f'{metric}_count{{phase="{label}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+
+# 전역 계측 인스턴스
+timing_recorder = TimingRecorder()
@@ -0,0 +1,321 @@
+# loadtest.py - 부하 테스트 스크립트
+#
+# 실행: python loadtest.py api [--clients 50] [--duration 10] [--target 127.0.0.1:8000]
+#   --target을 지정하지 않으면 메모리 저장소를 쓰는 API 서버를 같은 프로세스에서 실행
+#
+# 실행: python loadtest.py players [--players 100] [--games 3] [--answer-latency 0.05] [--error-rate 0.1]
+#   Streamlit 없이 게임 로직과 결과 저장을 동시 사용자 수만큼 스레드로 실행 (네트워크 불필요)
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+
+from config import GameConfig, UIConfig
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """정렬된 목록의 백분위 값 (가장 가까운 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+def print_latency_report(latencies: Dict[str, List[float]], elapsed: float):
+    """작업별 지연 시간 백분위와 처리량 출력"""
+    total = sum(len(values) for values in latencies.values())
+    print(f"{'작업':>10} {'횟수':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'최대(ms)':>9}")
+    for name, values in latencies.items():
+        values = sorted(values)
+        print(f"{name:>10} {len(values):>9,} {percentile(values, 50) * 1000:>9.2f} "
+              f"{percentile(values, 95) * 1000:>9.2f} {percentile(values, 99) * 1000:>9.2f} "
+              f"{values[-1] * 1000:>9.2f}")
+    print(f"총 {total:,}회 / {elapsed:.1f}초 = {total / elapsed:,.0f}회/초")
+
+def isolate_default_storage():
+    """
+    sheets_manager 모듈의 전역 인스턴스가 현재 디렉터리에 파일을 만들지 않도록
+    기본 저장 경로를 메모리 DB와 임시 디렉터리로 변경
+    
+    local_store, event_log 모듈을 처음 가져오기 전에 호출해야 합니다.
+    """
+    from config import EventLogConfig, LocalStoreConfig
+    
+    LocalStoreConfig.DB_PATH = ":memory:"
+    EventLogConfig.DIRECTORY = os.path.join(tempfile.gettempdir(), f"math-game-events-{os.getpid()}")
+
+def in_memory_sheets_manager(event_log_dir: Optional[str] = None):
+    """
+    Google Sheets 대신 메모리 저장소를 사용하는 SheetsManager 생성
+    
+    Args:
+        event_log_dir: 문제별 이벤트 로그 디렉터리 (없으면 임시 디렉터리)
+    """
+    from event_log import QuestionEventLog
+    from local_store import LocalResultStore
+    from sheets_manager import SheetsManager
+    from storage import InMemoryBackend
+    
+    if event_log_dir is None:
+        event_log_dir = tempfile.mkdtemp(prefix="math-game-events-")
+    return SheetsManager(backend=InMemoryBackend(), local_store=LocalResultStore(":memory:"),
+                         event_log=QuestionEventLog(event_log_dir))
+
+def solve_question(text: str) -> int:
+    """문제 문자열("12 + 34 = ?")의 정답 계산"""
+    num1, operator, num2 = text.split()[:3]
+    return int(num1) + int(num2) if operator == "+" else int(num1) - int(num2)
+
+class _HttpClient:
+    """keep-alive 연결 하나로 JSON 요청을 보내는 최소 HTTP/1.1 클라이언트"""
+    
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+    
+    async def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, Any]]:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self._writer.write(
+            f"{method} {path} HTTP/1.1\r\nhost: {self.host}\r\n"
+            f"content-type: application/json\r\ncontent-length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self._writer.drain()
+        
+        status = int((await self._reader.readline()).split()[1])
+        content_length = 0
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                content_length = int(value)
+        return status, json.loads(await self._reader.readexactly(content_length))
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+async def _api_player(host: str, port: int, deadline: float, latencies: Dict[str, List[float]]):
+    """게임 시작 → 문제마다 답안 제출 → 결과 조회를 마감 시각까지 반복"""
+    client = _HttpClient(host, port)
+    
+    async def timed(name: str, method: str, path: str, payload=None) -> Dict[str, Any]:
+        start = time.perf_counter()
+        status, data = await client.request(method, path, payload)
+        latencies[name].append(time.perf_counter() - start)
+        if status >= 400:
+            raise RuntimeError(f"{name} 요청 실패 ({status}): {data}")
+        return data
+    
+    session_id = None
+    try:
+        while time.perf_counter() < deadline:
+            game = await timed("start", "POST", "/games", {
+                "session_id": session_id,
+                "operation_type": UIConfig.OPERATION_TYPES[2],
+                "question_count": GameConfig.DEFAULT_QUESTIONS,
+                "time_limit": GameConfig.MAX_TIME_LIMIT
+            })
+            session_id = game["session_id"]
+            
+            question = await timed("question", "GET", f"/games/{session_id}/question")
+            while question is not None:
+                answer = solve_question(question["question"])
+                result = await timed("answer", "POST", f"/games/{session_id}/answers", {"answer": str(answer)})
+                question = result["next_question"]
+            
+            await timed("results", "GET", f"/games/{session_id}/results")
+    finally:
+        client.close()
+
+async def run_api_load_test(clients: int, duration: float, target: Optional[str] = None):
+    """
+    API 서버 부하 테스트
+    
+    Args:
+        clients: 동시에 게임을 진행하는 클라이언트 수
+        duration: 측정 시간 (초)
+        target: "호스트:포트" (없으면 같은 프로세스에서 서버 실행)
+    """
+    server = None
+    if target is None:
+        from api import GameApi, serve
+        
+        server = await serve(GameApi(manager=in_memory_sheets_manager()), "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+    else:
+        host, _, port = target.rpartition(":")
+        port = int(port)
+    
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            _api_player(host, port, start + duration, latencies) for _ in range(clients)
+        ))
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            server.close()
+    
+    print(f"## API 부하 테스트 ({host}:{port}, 클라이언트 {clients}개)")
+    print_latency_report(latencies, elapsed)
+
+class _Timer:
+    """작업별 소요 시간 기록 (플레이어 스레드마다 하나)"""
+    
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+    
+    def measure(self, name: str, func, *args, **kwargs):
+        """func를 실행하고 소요 시간을 name 작업으로 기록"""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.latencies[name].append(time.perf_counter() - start)
+        return result
+
+def _simulate_player(player_id: int, games: int, answer_latency: float, error_rate: float,
+                     registry, manager, operation_type: str) -> Dict[str, List[float]]:
+    """
+    한 플레이어의 게임 진행 시뮬레이션
+    
+    답안마다 answer_latency(초) 전후로 생각한 뒤, error_rate 확률로 틀린 답
+    (그중 절반은 숫자가 아닌 입력)을 제출합니다.
+    """
+    from validation import input_validator
+    
+    rng = random.Random(player_id)
+    timer = _Timer()
+    # 플레이어 번호를 세션 시드로 써서 실행할 때마다 같은 문제가 나오도록 함
+    session = registry.get(f"player-{player_id}", seed=player_id)
+    
+    for _ in range(games):
+        timer.measure("start", session.start_game, operation_type,
+                      GameConfig.DEFAULT_QUESTIONS, GameConfig.MAX_TIME_LIMIT, adaptive=True)
+        
+        while not session.is_game_finished():
+            question = timer.measure("question", session.get_current_question)
+            if answer_latency > 0:
+                time.sleep(rng.uniform(0.5, 1.5) * answer_latency)
+            
+            if rng.random() < error_rate:
+                user_input = str(question.answer + rng.choice((-10, -1, 1, 10))) if rng.random() < 0.5 else "1o"
+            else:
+                user_input = str(question.answer)
+            
+            timer.measure("validate", input_validator.validate_number_input, user_input)
+            timer.measure("submit", session.submit_answer, user_input)
+            timer.measure("next", session.next_question)
+        
+        results = timer.measure("results", session.get_final_results)
+        timer.measure("save", manager.save_game_result,
+                      results['total_questions'], results['correct_count'], results['accuracy'],
+                      results['operation_type'], results['time_limit'], results['total_time'],
+                      game_id=results['game_id'], replay=session.get_replay_record(),
+                      questions=session.questions)
+        # 백엔드에는 백그라운드 동기화 후에야 행이 들어오므로, 방금 저장한 행이
+        # 포함되는 로컬 저장소 통계를 측정
+        timer.measure("stats", manager.local_store.fetch_aggregates)
+    
+    return timer.latencies
+
+def run_player_simulation(players: int, games: int, answer_latency: float, error_rate: float,
+                          trace_memory: bool = False):
+    """
+    동시 플레이어 시뮬레이션 (Google Sheets 대신 메모리 저장소 사용)
+    
+    Args:
+        players: 동시에 게임하는 플레이어 수 (플레이어마다 스레드 하나)
+        games: 플레이어당 게임 수
+        answer_latency: 평균 답안 입력 시간 (초)
+        error_rate: 틀린 답을 제출할 확률
+        trace_memory: True이면 tracemalloc으로 파이썬 할당량도 측정 (느려짐)
+    """
+    from game_logic import SessionRegistry
+    
+    registry = SessionRegistry(max_sessions=max(players, 1))
+    manager = in_memory_sheets_manager()
+    operation_type = UIConfig.OPERATION_TYPES[2]
+    
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=players) as executor:
+        futures = [
+            executor.submit(_simulate_player, player_id, games, answer_latency, error_rate,
+                            registry, manager, operation_type)
+            for player_id in range(players)
+        ]
+        player_latencies = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+    
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    for player in player_latencies:
+        for name, values in player.items():
+            latencies[name].extend(values)
+    
+    print(f"## 동시 플레이어 시뮬레이션 (플레이어 {players}명 x 게임 {games}회, "
+          f"답안 입력 {answer_latency * 1000:.0f}ms, 오답률 {error_rate:.0%})")
+    print_latency_report(latencies, elapsed)
+    
+    answers = len(latencies["submit"])
+    _, saved_rows = manager.local_store.stream_rows(0)
+    print(f"답안 처리량: {answers / elapsed:,.0f}개/초, 저장된 결과: {len(saved_rows):,}건")
+    
+    from event_log import load_events
+    
+    manager.event_log.close()
+    events = load_events(manager.event_log.directory)
+    event_bytes = sum(entry.stat().st_size for entry in os.scandir(manager.event_log.directory))
+    print(f"문제별 이벤트: {len(events):,}건, Parquet {event_bytes / 1024:,.1f}KB "
+          f"({manager.event_log.directory})")
+    if trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"파이썬 할당 메모리: 현재 {current / 1024 ** 2:.1f}MB, 최대 {peak / 1024 ** 2:.1f}MB")
+    # Linux에서 ru_maxrss 단위는 KB
+    print(f"최대 RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}MB, "
+          f"보관 중인 세션: {len(registry)}개")
+
+def main():
+    parser = argparse.ArgumentParser(description="두 자리 수 암산 게임 부하 테스트")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    api_parser = subparsers.add_parser("api", help="HTTP/JSON API 서버 부하 테스트")
+    api_parser.add_argument("--clients", type=int, default=50)
+    api_parser.add_argument("--duration", type=float, default=10.0)
+    api_parser.add_argument("--target", help="호스트:포트 (없으면 같은 프로세스에서 서버 실행)")
+    
+    players_parser = subparsers.add_parser("players", help="동시 플레이어 시뮬레이션 (오프라인)")
+    players_parser.add_argument("--players", type=int, default=100)
+    players_parser.add_argument("--games", type=int, default=3)
+    players_parser.add_argument("--answer-latency", type=float, default=0.05, help="평균 답안 입력 시간 (초)")
+    players_parser.add_argument("--error-rate", type=float, default=0.1, help="틀린 답을 제출할 확률")
+    players_parser.add_argument("--trace-memory", action="store_true", help="tracemalloc으로 할당 메모리 측정")
+    
+    args = parser.parse_args()
+    
+    # 결과 저장마다 남는 INFO 로그 생략
+    logging.disable(logging.INFO)
+    isolate_default_storage()
+    if args.command == "api":
+        asyncio.run(run_api_load_test(args.clients, args.duration, args.target))
+    elif args.command == "players":
+        run_player_simulation(args.players, args.games, args.answer_latency, args.error_rate, args.trace_memory)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# local_store.py - 게임 결과 로컬 저장소 (write-ahead)
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import LocalStoreConfig
+from storage import StorageBackend
+
+class LocalResultStore(StorageBackend):
+    """
+    게임 결과를 SQLite에 먼저 기록하는 추가 전용 저장소
+    
+    모든 결과는 이곳에 먼저 저장되고, 동기화 작업이 아직 전송되지 않은
+    행을 주 저장소 백엔드로 옮긴 뒤 전송 완료로 표시합니다.
+    """
+    
+    def __init__(self, db_path: str = LocalStoreConfig.DB_PATH):
+        super().__init__()
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                game_id TEXT UNIQUE,
+                row_json TEXT NOT NULL,
+                synced INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_results_unsynced ON results (synced, id)"
+        )
+        # 게임 재생 기록 (문제는 시드로 다시 만들 수 있으므로 설정, 시드, 답안만 저장)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS replays (
+                game_id TEXT PRIMARY KEY,
+                record_json TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+    
+    def append(self, row_data: List[str], game_id: Optional[str] = None,
+               replay: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        결과 행 추가
+        
+        Args:
+            row_data: 저장할 행 데이터
+            game_id: 게임 고유 ID (같은 ID는 한 번만 저장)
+            replay: 게임 재생 기록 (GameSession.get_replay_record(), game_id가 있을 때만 저장)
+        
+        Returns:
+            bool: 새로 저장되었으면 True, 이미 저장된 게임이면 False
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO results (game_id, row_json, created_at) VALUES (?, ?, ?)",
+                (game_id, json.dumps(row_data, ensure_ascii=False), time.time())
+            )
+            is_new = cursor.rowcount == 1
+            if is_new and replay is not None and game_id is not None:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO replays (game_id, record_json) VALUES (?, ?)",
+                    (game_id, json.dumps(replay, ensure_ascii=False, separators=(",", ":")))
+                )
+            self._conn.commit()
+            return is_new
+    
+    def fetch_replay(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """게임 재생 기록 반환 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record_json FROM replays WHERE game_id = ?", (game_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def save_results(self, rows: List[List[str]]):
+        # 백엔드로 쓸 때는 이미 중복이 걸러진 행만 들어오므로 game_id 없이 저장
+        for row in rows:
+            self.append(row)
+    
+    def fetch_unsynced(self, limit: int) -> List[Tuple[int, List[str]]]:
+        """아직 전송되지 않은 행을 오래된 순으로 최대 limit개 반환"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, row_json FROM results WHERE synced = 0 ORDER BY id LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [(row_id, json.loads(row_json)) for row_id, row_json in rows]
+    
+    def mark_synced(self, row_ids: List[int]):
+        """행들을 전송 완료로 표시"""
+        if not row_ids:
+            return
+        
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE results SET synced = 1 WHERE id = ?",
+                [(row_id,) for row_id in row_ids]
+            )
+            self._conn.commit()
+    
+    def count_unsynced(self) -> int:
+        """전송 대기 중인 행 수 반환"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM results WHERE synced = 0"
+            ).fetchone()[0]
+    
+    def stream_rows(self, cursor: int) -> Tuple[int, List[List[str]]]:
+        """행 ID가 cursor보다 큰 모든 행 반환"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, row_json FROM results WHERE id > ? ORDER BY id",
+                (cursor,)
+            ).fetchall()
+        
+        if not rows:
+            return cursor, []
+        return rows[-1][0], [json.loads(row_json) for _, row_json in rows]
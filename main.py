@@ -2,20 +2,25 @@
 
 import streamlit as st
 import time
+import uuid
 
 # 로컬 모듈 임포트
-from config import GameConfig, UIConfig
-from styles import get_custom_css, get_google_analytics, get_auto_focus_script
-from game_logic import game_session, QuestionGenerator
+from config import GameConfig, UIConfig, AdaptiveConfig, ErrorMessages
+from assets import inject_assets
+from game_logic import session_registry, GameSession, QuestionGenerator
 from sheets_manager import sheets_manager
 from ui_components import game_setup_ui, game_play_ui, game_result_ui, common_ui
 from validation import input_validator
+from instrumentation import timing_recorder
 import streamlit.components.v1 as components 
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 class GameStates:
     """게임 상태 상수"""
     SETUP = 'setup'
     PLAYING = 'playing'  
+    CLIENT_PLAYING = 'client_playing'
+    FEEDBACK = 'feedback'
     FINISHED = 'finished'
 
 def initialize_session_state():
@@ -30,13 +35,53 @@ def initialize_session_state():
         'total_questions': 0,
         'total_correct': 0,
         'best_streak': 0,
-        'current_streak': 0
+        'current_streak': 0,
+        'recorded_game_id': None,
+        'feedback': None,
+        'feedback_deadline': 0.0,
+        'client_mode': False
     }
     
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
+def get_session_id() -> str:
+    """현재 브라우저 세션의 Streamlit 세션 ID 반환"""
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        return ctx.session_id
+    
+    # 스크립트 컨텍스트가 없는 경우 (테스트 등) 세션 상태에 임시 ID 보관
+    if 'fallback_session_id' not in st.session_state:
+        st.session_state.fallback_session_id = uuid.uuid4().hex
+    return st.session_state.fallback_session_id
+
+def get_game_session() -> GameSession:
+    """현재 사용자의 게임 세션 반환"""
+    return session_registry.get(get_session_id())
+
+def recover_lost_game():
+    """
+    게임 중이거나 결과 화면인데 게임 세션이 만료로 사라졌으면 설정 화면으로 되돌림
+    
+    세션 레지스트리가 유휴 세션을 제거한 뒤에는 빈 GameSession이 새로 만들어지므로,
+    그대로 두면 문제를 불러올 수 없다는 오류에서 벗어날 수 없습니다.
+    """
+    game_state = st.session_state.game_state
+    game_session = get_game_session()
+    
+    if game_state in (GameStates.PLAYING, GameStates.FEEDBACK, GameStates.CLIENT_PLAYING):
+        is_lost = not game_session.is_active
+    elif game_state == GameStates.FINISHED:
+        is_lost = game_session.game_id is None
+    else:
+        is_lost = False
+    
+    if is_lost:
+        reset_game()
+        st.rerun()
+
 def setup_page():
     """페이지 기본 설정"""
     st.set_page_config(
@@ -45,10 +90,11 @@ def setup_page():
         layout="centered"
     )
     
-    # 스타일 및 스크립트 적용
-    st.markdown(get_custom_css(), unsafe_allow_html=True)
-    st.markdown(get_google_analytics(), unsafe_allow_html=True)
+    # 스타일 및 스크립트 적용 (브라우저 세션마다 한 번만 전송)
+    with timing_recorder.phase("setup_page.assets"):
+        inject_assets()
 
+@timing_recorder.timed()
 def handle_game_setup():
     """게임 설정 화면 처리"""
     st.markdown("### ⚙️ 게임 설정")
@@ -86,33 +132,171 @@ def handle_game_setup():
             "초"
         )
         
-        st.markdown("<br><br>", unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # 진행 방식 선택
+        st.session_state.client_mode = game_setup_ui.render_mode_selector(st.session_state.client_mode)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
         
         # 게임 시작 버튼
         if st.button("🚀 게임 시작!", use_container_width=True, type="primary"):
             try:
-                game_session.start_game(
-                    st.session_state.operation_type,
-                    st.session_state.question_count,
-                    st.session_state.time_limit
-                )
-                st.session_state.game_state = GameStates.PLAYING
-                st.session_state.current_question_num = 1
+                start_new_game(get_game_session())
                 st.rerun()
             except ValueError as e:
                 st.error(f"설정 오류: {str(e)}")
 
+def start_new_game(game_session: GameSession):
+    """현재 설정과 진행 방식으로 새 게임 시작"""
+    if st.session_state.client_mode:
+        game_session.start_client_game(
+            st.session_state.operation_type,
+            st.session_state.question_count,
+            st.session_state.time_limit
+        )
+        st.session_state.game_state = GameStates.CLIENT_PLAYING
+    else:
+        game_session.start_game(
+            st.session_state.operation_type,
+            st.session_state.question_count,
+            st.session_state.time_limit,
+            adaptive=AdaptiveConfig.ENABLED
+        )
+        st.session_state.game_state = GameStates.PLAYING
+    st.session_state.current_question_num = 1
+
+@timing_recorder.timed()
+def handle_client_game():
+    """
+    브라우저 진행 게임 화면 처리
+    
+    문제 배치를 한 번 내려보낸 뒤에는 게임이 끝날 때까지 서버 재실행이 없고,
+    답안이 한 번에 도착하면 채점 후 결과 화면으로 이동합니다.
+    """
+    game_session = get_game_session()
+    if not game_session.is_client_game:
+        reset_game()
+        st.rerun()
+    
+    event = game_play_ui.render_game_runner(game_session.get_client_batch())
+    
+    if event:
+        try:
+            game_session.submit_client_results(event.get('seed'), event.get('answers') or [],
+                                               event.get('response_times') or [])
+        except ValueError as e:
+            st.error(f"결과 제출 오류: {str(e)}")
+            if st.button("🔄 다시 시작", type="secondary"):
+                reset_game()
+                st.rerun()
+            return
+        
+        update_streaks(game_session.questions.correctness.tolist())
+        st.session_state.game_state = GameStates.FINISHED
+        st.rerun()
+    
+    # 게임 리셋 버튼
+    if st.button("🔄 게임 리셋", type="secondary"):
+        reset_game()
+        st.rerun()
+
+def update_streaks(correctness: list):
+    """브라우저 진행 게임의 문제별 정답 여부(1/0)로 연속 정답 기록 갱신"""
+    for is_correct in correctness:
+        if is_correct == 1:
+            st.session_state.current_streak += 1
+            st.session_state.best_streak = max(st.session_state.best_streak, st.session_state.current_streak)
+        else:
+            st.session_state.current_streak = 0
+
+@timing_recorder.timed()
 def handle_game_play():
     """게임 플레이 화면 처리"""
-    # 자동 포커스 스크립트 적용
-    #st.markdown(get_auto_focus_script(), unsafe_allow_html=True)
-    components.html(get_auto_focus_script(), height=0)
+    game_session = get_game_session()
+    
+    # 게임 헤더 및 현재 문제 표시
+    current_num = render_current_question(game_session)
+    if current_num is None:
+        return
+    
+    # 답안 입력 (포커스, Enter 제출, 남은 시간 표시는 브라우저에서 처리)
+    remaining, _ = game_session.get_timer_state()
+    event = game_play_ui.render_answer_pad(
+        get_question_key(game_session, current_num), remaining, game_session.time_limit
+    )
+    
+    # 시간 초과 확인 (컴포넌트가 마감을 알리지 못한 경우에 대비)
+    render_live_timer()
     
+    # 컴포넌트가 먼저 시간 초과를 알린 경우
+    if event and event.get('timed_out'):
+        expire_current_question(game_session)
+        st.rerun()
+    
+    # 답안 제출 처리
+    if event and str(event.get('answer') or '').strip():
+        is_correct, message, is_timeout = game_session.submit_answer(str(event['answer']))
+        
+        # 연속 정답 처리
+        if is_correct:
+            st.session_state.current_streak += 1
+            if st.session_state.current_streak > st.session_state.best_streak:
+                st.session_state.best_streak = st.session_state.current_streak
+        else:
+            st.session_state.current_streak = 0
+        
+        # 피드백 단계로 전환 (다음 문제 이동은 피드백 종료 시)
+        start_feedback(is_correct, message, is_timeout)
+        st.rerun()
+    
+    # 게임 리셋 버튼
+    if st.button("🔄 게임 리셋", type="secondary"):
+        reset_game()
+        st.rerun()
+
+@st.fragment(run_every=GameConfig.TIMER_TICK_INTERVAL)
+def render_live_timer():
+    """
+    시간 초과 감시
+    
+    남은 시간은 답안 입력 컴포넌트가 브라우저에서 표시하므로 이 프래그먼트는
+    아무것도 그리지 않고, TIMER_TICK_INTERVAL마다 서버 시각 기준으로 시간
+    초과만 확인합니다.
+    """
+    if st.session_state.game_state != GameStates.PLAYING:
+        return
+    
+    game_session = get_game_session()
+    _, is_expired = game_session.get_timer_state()
+    
+    if is_expired:
+        expire_current_question(game_session)
+        st.rerun()
+
+def get_question_key(game_session: GameSession, question_num: int) -> str:
+    """답안 입력 컴포넌트에 넘길 문제 키 (이전 게임의 이벤트와 구분되도록 게임 ID 포함)"""
+    return f"{game_session.game_id}:{question_num}"
+
+def expire_current_question(game_session: GameSession):
+    """현재 문제를 시간 초과로 처리하고 피드백 단계로 전환"""
+    game_session.record_timeout()
+    st.session_state.current_streak = 0
+    start_feedback(False, ErrorMessages.TIME_UP, True)
+
+@timing_recorder.timed()
+def render_current_question(game_session: GameSession):
+    """
+    게임 헤더와 현재 문제 표시
+    
+    Returns:
+        Optional[int]: 현재 문제 번호 (문제를 불러올 수 없으면 None)
+    """
     # 현재 문제 가져오기
     current_question = game_session.get_current_question()
     if not current_question:
         st.error("문제를 불러올 수 없습니다.")
-        return
+        return None
     
     # 게임 헤더 표시
     current_num, total_num = game_session.get_game_progress()
@@ -127,85 +311,93 @@ def handle_game_play():
     st.session_state.current_question_num = current_num
     game_play_ui.render_question_display(str(current_question))
     
-    # 시간 제한 확인 및 타이머 표시
-    is_time_valid, remaining_time = game_session.check_time_limit()
-    remaining = max(0, st.session_state.time_limit - remaining_time)
+    return current_num
+
+def start_feedback(is_correct: bool, message: str, is_timeout: bool):
+    """피드백 단계 시작 (FEEDBACK_DURATION 동안 결과 메시지 표시)"""
+    st.session_state.feedback = (is_correct, message, is_timeout)
+    st.session_state.feedback_deadline = time.time() + GameConfig.FEEDBACK_DURATION
+    st.session_state.game_state = GameStates.FEEDBACK
+
+def finish_feedback():
+    """피드백 단계 종료 후 다음 문제 또는 결과 화면으로 이동"""
+    game_session = get_game_session()
+    game_session.next_question()
+    st.session_state.feedback = None
     
-    timer_bar = game_play_ui.render_timer(remaining, st.session_state.time_limit)
+    # 게임 종료 확인
+    if game_session.is_game_finished():
+        st.session_state.game_state = GameStates.FINISHED
+    else:
+        st.session_state.game_state = GameStates.PLAYING
+
+@timing_recorder.timed()
+def handle_feedback():
+    """
+    피드백 화면 처리
     
-    # 시간 초과 처리
-    if not is_time_valid:
-        if timer_bar:
-            timer_bar.empty()
-        st.session_state.current_streak = 0
-        time.sleep(1.0)
-        game_session.next_question()
-        
-        if game_session.is_game_finished():
-            st.session_state.game_state = GameStates.FINISHED
-        st.rerun()
+    서버 스레드에서 대기하지 않고, 주기적으로 실행되는 프래그먼트가
+    피드백 마감 시각이 지났는지 확인해 다음 문제로 넘어갑니다.
+    """
+    game_session = get_game_session()
     
-    # 답안 입력 폼
-    user_input, submitted = game_play_ui.render_answer_form(str(current_num))
+    current_num = render_current_question(game_session)
+    if current_num is None:
+        return
     
-    # 답안 제출 처리
-    if submitted and user_input.strip():
-        is_correct, message, is_timeout = game_session.submit_answer(user_input)
-        
-        # 연속 정답 처리
-        if is_correct:
-            st.session_state.current_streak += 1
-            if st.session_state.current_streak > st.session_state.best_streak:
-                st.session_state.best_streak = st.session_state.current_streak
-        else:
-            st.session_state.current_streak = 0
-        
-        # 피드백 표시
-        common_ui.show_feedback_message(is_correct, message, is_timeout)
-        
-        time.sleep(1.0)
-        game_session.next_question()
-        
-        # 게임 종료 확인
-        if game_session.is_game_finished():
-            st.session_state.game_state = GameStates.FINISHED
-        
-        st.rerun()
+    # 답안 입력 컴포넌트는 같은 위치에 비활성 상태로 유지 (iframe 재생성 방지)
+    game_play_ui.render_answer_pad(
+        get_question_key(game_session, current_num), 0.0, game_session.time_limit, disabled=True
+    )
     
-    # 게임 리셋 버튼
-    if st.button("🔄 게임 리셋", type="secondary"):
-        reset_game()
+    # 피드백 메시지 표시
+    if st.session_state.feedback:
+        common_ui.show_feedback_message(*st.session_state.feedback)
+    
+    wait_for_feedback_deadline()
+
+@st.fragment(run_every=GameConfig.FEEDBACK_POLL_INTERVAL)
+def wait_for_feedback_deadline():
+    """피드백 마감 시각 확인 (이 프래그먼트만 주기적으로 재실행)"""
+    if st.session_state.game_state != GameStates.FEEDBACK:
+        return
+    
+    if time.time() >= st.session_state.feedback_deadline:
+        finish_feedback()
         st.rerun()
 
+@timing_recorder.timed()
 def handle_game_results():
     """게임 결과 화면 처리"""
+    game_session = get_game_session()
+    
     # 최종 결과 가져오기
     results = game_session.get_final_results()
     
     # 결과 요약 표시
     game_result_ui.render_result_summary(results)
     
-    # 결과 저장 (Google Sheets)
-    if sheets_manager.is_enabled:
-        with st.spinner("결과를 저장하는 중..."):
-            sheets_manager.save_game_result(
-                results['total_questions'],
-                results['correct_count'],
-                results['accuracy'],
-                results['operation_type'],
-                results['time_limit'],
-                results['total_time']
-            )
-    
-    # 세션 통계 업데이트
-    update_session_stats(results)
-    
-    # 전체 사용자 통계 표시
-    if sheets_manager.is_enabled:
-        with st.spinner("전체 통계를 불러오는 중..."):
-            global_stats = sheets_manager.get_global_statistics()
-    else:
-        global_stats = None
+    # 결과 저장 (로컬에 먼저 기록, Google Sheets는 백그라운드에서 동기화)
+    sheets_manager.save_game_result(
+        results['total_questions'],
+        results['correct_count'],
+        results['accuracy'],
+        results['operation_type'],
+        results['time_limit'],
+        results['total_time'],
+        game_id=results['game_id'],
+        replay=game_session.get_replay_record(),
+        questions=game_session.questions
+    )
+    
+    # 세션 통계 업데이트 (게임당 한 번만)
+    if st.session_state.recorded_game_id != results['game_id']:
+        update_session_stats(results)
+        st.session_state.recorded_game_id = results['game_id']
+    
+    # 전체 사용자 통계 표시 (시트 미연결 시 로컬 데이터 사용)
+    with st.spinner("전체 통계를 불러오는 중..."):
+        global_stats = sheets_manager.get_global_statistics()
     
     game_result_ui.render_global_statistics(global_stats, results['accuracy'])
     
@@ -215,13 +407,7 @@ def handle_game_results():
     if restart_same:
         # 같은 설정으로 다시 시작
         try:
-            game_session.start_game(
-                st.session_state.operation_type,
-                st.session_state.question_count,
-                st.session_state.time_limit
-            )
-            st.session_state.game_state = GameStates.PLAYING
-            st.session_state.current_question_num = 1
+            start_new_game(game_session)
             st.rerun()
         except ValueError as e:
             st.error(f"게임 시작 오류: {str(e)}")
@@ -238,6 +424,8 @@ def update_session_stats(results: dict):
 
 def reset_game():
     """게임 상태 리셋"""
+    game_session = get_game_session()
+    
     game_session.reset()
     st.session_state.game_state = GameStates.SETUP
     st.session_state.current_question_num = 1
@@ -266,6 +454,7 @@ def render_session_stats():
     else:
         st.markdown("<div style='text-align: center; color: #666;'>📊 통계 준비 중...</div>", unsafe_allow_html=True)
 
+@timing_recorder.timed()
 def main():
     """메인 애플리케이션 실행"""
     # 페이지 설정
@@ -273,6 +462,7 @@ def main():
     
     # 세션 상태 초기화  
     initialize_session_state()
+    recover_lost_game()
     
     # 페이지 헤더
     common_ui.render_page_header()
@@ -280,15 +470,24 @@ def main():
     # 게임 상태에 따른 화면 렌더링
     if st.session_state.game_state == GameStates.SETUP:
         handle_game_setup()
-        
+    
     elif st.session_state.game_state == GameStates.PLAYING:
         handle_game_play()
-        
+    
+    elif st.session_state.game_state == GameStates.CLIENT_PLAYING:
+        handle_client_game()
+    
+    elif st.session_state.game_state == GameStates.FEEDBACK:
+        handle_feedback()
+    
     elif st.session_state.game_state == GameStates.FINISHED:
         handle_game_results()
     
     # 페이지 푸터
     common_ui.render_footer()
+    
+    # 계측을 켠 경우(GAME_INSTRUMENTATION=1) 구간별 실행 시간 표시
+    debug_timings()
 
 # 개발/디버그용 함수들
 def debug_session_state():
@@ -298,6 +497,8 @@ def debug_session_state():
 
 def debug_game_session():
     """게임 세션 디버그 (개발시에만 사용)"""
+    game_session = get_game_session()
+    
     if st.sidebar.button("Debug: Show Game Session"):
         if game_session.questions:
             current_q = game_session.get_current_question()
@@ -305,6 +506,15 @@ def debug_game_session():
             st.sidebar.write(f"Progress: {game_session.current_question_index + 1}/{len(game_session.questions)}")
             st.sidebar.write(f"Correct Count: {game_session.correct_count}")
 
+def debug_timings():
+    """구간별 실행 시간 표시 (GAME_INSTRUMENTATION=1 로 실행한 경우)"""
+    if not timing_recorder.enabled:
+        return
+    
+    if st.sidebar.button("Debug: Show Timings"):
+        st.sidebar.dataframe(timing_recorder.summary(), use_container_width=True)
+        st.sidebar.code(timing_recorder.render_prometheus(), language="text")
+
 # 애플리케이션 실행
 if __name__ == "__main__":
     main()
@@ -0,0 +1,134 @@
+# result_writer.py - 게임 결과 비동기 동기화 모듈
+
+import atexit
+import logging
+import threading
+from typing import Callable, List
+
+import gspread
+
+from config import SheetsConfig
+from local_store import LocalResultStore
+
+logger = logging.getLogger(__name__)
+
+class ResultWriter:
+    """
+    로컬 저장소의 미전송 행을 백그라운드 스레드에서 모아서 저장하는 클래스
+    
+    새 행이 들어오면 깨어나 최대 batch_size개씩 append_rows 한 번으로 저장하며,
+    API 오류 시 지수 백오프로 재시도합니다. 실패한 행은 로컬 저장소에 남아
+    다음 주기에 다시 전송되며, 저장이 연속으로 실패하면 다음 시도까지의
+    간격을 max_backoff까지 두 배씩 늘립니다.
+    """
+    
+    def __init__(self, store: LocalResultStore,
+                 append_rows: Callable[[List[List[str]]], None],
+                 batch_size: int = SheetsConfig.WRITE_BATCH_SIZE,
+                 flush_interval: float = SheetsConfig.WRITE_FLUSH_INTERVAL,
+                 max_retries: int = SheetsConfig.WRITE_MAX_RETRIES,
+                 retry_base_delay: float = SheetsConfig.WRITE_RETRY_BASE_DELAY,
+                 max_backoff: float = SheetsConfig.WRITE_MAX_BACKOFF):
+        self._store = store
+        self._append_rows = append_rows
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.max_backoff = max_backoff
+        
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+    
+    def notify(self):
+        """새 행이 저장되었음을 알림 (즉시 반환)"""
+        self._ensure_started()
+        self._wake_event.set()
+    
+    def _ensure_started(self):
+        """작업 스레드가 없으면 시작"""
+        if self._thread is not None:
+            return
+        
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="result-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+    
+    def _run(self):
+        """미전송 행을 주기적으로 저장"""
+        failures = 0
+        while not self._stop_event.is_set():
+            if failures:
+                # 연속 실패 중에는 새 행 알림과 관계없이 백오프 시간만큼 대기
+                self._stop_event.wait(self._backoff_delay(failures))
+            else:
+                # 새 행 알림 또는 저장 주기까지 대기한 뒤, 배치가 다 차지 않았으면
+                # 잠시 더 모아서 저장
+                self._wake_event.wait(self.flush_interval)
+                self._wake_event.clear()
+                if self._store.count_unsynced() < self.batch_size:
+                    self._stop_event.wait(self.flush_interval)
+            
+            if self.flush():
+                if failures:
+                    logger.info(f"미전송 게임 결과 저장 재개 (연속 실패 {failures}회 후)")
+                failures = 0
+            elif not self._stop_event.is_set():
+                failures += 1
+                logger.warning(f"미전송 게임 결과 저장 실패, {self._backoff_delay(failures):.1f}초 후 다시 시도")
+    
+    def _backoff_delay(self, failures: int) -> float:
+        """연속 실패 횟수에 따른 다음 시도까지의 대기 시간 (초)"""
+        return min(self.flush_interval * (2 ** failures), self.max_backoff)
+    
+    def _write_with_retry(self, batch: List[List[str]]) -> bool:
+        """API 오류 시 지수 백오프로 재시도하며 저장"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._append_rows(batch)
+                logger.info(f"게임 결과 {len(batch)}건 저장 완료")
+                return True
+            except gspread.exceptions.APIError as e:
+                if attempt == self.max_retries or self._stop_event.is_set():
+                    logger.error(f"게임 결과 {len(batch)}건 저장 실패 (재시도 초과): {str(e)}")
+                    return False
+                
+                delay = self.retry_base_delay * (2 ** attempt)
+                logger.warning(f"API 오류로 {delay:.1f}초 후 재시도: {str(e)}")
+                self._stop_event.wait(delay)
+            except Exception as e:
+                logger.error(f"게임 결과 {len(batch)}건 저장 실패: {str(e)}")
+                return False
+        
+        return False
+    
+    def flush(self) -> bool:
+        """
+        로컬 저장소의 미전송 행을 모두 저장
+        
+        Returns:
+            bool: 모든 행을 저장했으면 True
+        """
+        while True:
+            pending = self._store.fetch_unsynced(self.batch_size)
+            if not pending:
+                return True
+            
+            row_ids = [row_id for row_id, _ in pending]
+            if not self._write_with_retry([row for _, row in pending]):
+                return False
+            
+            self._store.mark_synced(row_ids)
+    
+    def close(self, timeout: float = 10.0):
+        """작업 스레드를 종료하고 남은 행 저장"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -1,61 +1,141 @@
 # sheets_manager.py - Google Sheets 관리 모듈
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any, List
 import logging
+import threading
+import time
 
-from config import SheetsConfig, ErrorMessages
+from config import SheetsConfig, StorageConfig, ErrorMessages
 from validation import data_validator
+from local_store import LocalResultStore
+from event_log import QuestionEventLog
+from game_logic import QuestionSet
+from result_writer import ResultWriter
+from stats_engine import AccuracyRankIndex
+from instrumentation import timing_recorder
+from storage import StorageBackend, SheetsConnectionPool, create_backend
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _get_secret(key: str, default=None):
+    """secrets 값 조회 (secrets 파일이 없으면 기본값 반환)"""
+    try:
+        return st.secrets.get(key, default)
+    except Exception:
+        return default
+
+def _show_message(kind: str, message: str):
+    """
+    Streamlit 화면에 메시지 표시 (API 서버 등 Streamlit 실행 중이 아니면 생략)
+    
+    Args:
+        kind: 메시지 종류 ("success", "info", "warning", "error")
+        message: 표시할 메시지
+    """
+    if get_script_run_ctx(suppress_warning=True) is not None:
+        getattr(st, kind)(message)
+
+@st.cache_resource(show_spinner=False, validate=lambda pool: pool.is_healthy())
+def get_connection_pool() -> SheetsConnectionPool:
+    """
+    Google Sheets 연결 풀 생성 (프로세스 전체에서 공유)
+    
+    연결 확인에 실패하면 예외가 발생하며 캐시되지 않습니다.
+    """
+    creds = ServiceAccountCredentials.from_json_keyfile_dict(
+        st.secrets["gcp_service_account"], 
+        SheetsConfig.SCOPES
+    )
+    sheet_id = st.secrets.get("GOOGLE_SHEET_ID", SheetsConfig.DEFAULT_SHEET_ID)
+    
+    pool = SheetsConnectionPool(creds, sheet_id)
+    
+    # 첫 연결을 미리 열어 설정 오류를 바로 확인
+    with pool.acquire():
+        pass
+    return pool
+
 class SheetsManager:
-    """Google Sheets 연결 및 데이터 관리 클래스"""
+    """결과 저장소 연결 및 데이터 관리 클래스 (기본 저장소: Google Sheets)"""
     
-    def __init__(self):
-        self.client = None
-        self.spreadsheet = None
-        self.sheet = None
-        self.is_enabled = False
-        self._initialize_connection()
+    def __init__(self, backend: Optional[StorageBackend] = None,
+                 local_store: Optional[LocalResultStore] = None,
+                 event_log: Optional[QuestionEventLog] = None):
+        """
+        Args:
+            backend: 사용할 저장소 백엔드 (없으면 설정에 따라 처음 사용할 때 생성)
+            local_store: 결과를 먼저 기록할 로컬 저장소
+            event_log: 문제별 답안 이벤트 로그
+        """
+        # 연결은 처음 사용할 때 생성
+        self.backend = backend
+        self._connection_attempted = backend is not None
+        self._connection_lock = threading.Lock()
+        
+        # 결과는 로컬 저장소에 먼저 기록하고, 백그라운드에서 백엔드로 동기화
+        self.local_store = local_store if local_store is not None else LocalResultStore()
+        self._writer = ResultWriter(self.local_store, self._append_rows)
+        
+        # 문제별 답안은 시트와 별도로 Parquet 이벤트 로그에 기록
+        self.event_log = event_log if event_log is not None else QuestionEventLog()
+        
+        # 이전 실행에서 전송하지 못한 행이 있으면 동기화 시작
+        if self.local_store.count_unsynced() > 0:
+            self._writer.notify()
+    
+    @property
+    def is_enabled(self) -> bool:
+        """저장소 백엔드 사용 가능 여부 (처음 확인할 때 연결)"""
+        if not self._connection_attempted:
+            with self._connection_lock:
+                if not self._connection_attempted:
+                    self._initialize_connection()
+        return self.backend is not None
     
-    def _initialize_connection(self):
-        """Google Sheets 연결 초기화"""
+    def _initialize_connection(self, show_warning: bool = True):
+        """저장소 백엔드 연결 초기화"""
+        self._connection_attempted = True
+        backend_name = _get_secret("STORAGE_BACKEND", StorageConfig.BACKEND)
         try:
-            creds = ServiceAccountCredentials.from_json_keyfile_dict(
-                st.secrets["gcp_service_account"], 
-                SheetsConfig.SCOPES
-            )
-            self.client = gspread.authorize(creds)
-            
-            sheet_id = st.secrets.get("GOOGLE_SHEET_ID", SheetsConfig.DEFAULT_SHEET_ID)
-            self.spreadsheet = self.client.open_by_key(sheet_id)
-            self.sheet = self.spreadsheet.worksheet("Sheet1")
-            
-            self.is_enabled = True
-            logger.info("Google Sheets 연결 성공")
+            backend = create_backend(backend_name, get_connection_pool)
+            backend.connect()
+            self.backend = backend
+            logger.info(f"저장소 연결 성공: {backend_name}")
             
         except Exception as e:
-            self.is_enabled = False
-            logger.error(f"Google Sheets 연결 실패: {str(e)}")
-            self._show_connection_warning(str(e))
+            self.backend = None
+            logger.error(f"저장소 연결 실패 ({backend_name}): {str(e)}")
+            if show_warning:
+                self._show_connection_warning(str(e))
     
     def _show_connection_warning(self, error_message: str):
         """연결 실패 경고 표시"""
+        if get_script_run_ctx(suppress_warning=True) is None:
+            return
+        
         st.warning(f"⚠️ {ErrorMessages.SHEETS_CONNECTION_ERROR}")
         with st.expander("오류 세부사항"):
             st.error(f"설정 오류: {error_message}")
     
+    @timing_recorder.timed()
     def save_game_result(self, total_questions: int, correct_count: int, 
                         accuracy: float, operation_type: str, 
-                        time_limit: int, elapsed_time: float) -> bool:
+                        time_limit: int, elapsed_time: float,
+                        game_id: Optional[str] = None,
+                        replay: Optional[Dict[str, Any]] = None,
+                        questions: Optional[QuestionSet] = None) -> bool:
         """
-        게임 결과를 Google Sheets에 저장
+        게임 결과를 로컬 저장소에 기록하고 저장소 백엔드 동기화 예약
+        
+        같은 game_id의 결과는 한 번만 저장됩니다. SQLite는 NULL끼리 서로 다른
+        값으로 보므로 game_id가 없으면 중복을 막을 수 없어 저장하지 않습니다.
         
         Args:
             total_questions: 총 문제 수
@@ -64,18 +144,22 @@ class SheetsManager:
             operation_type: 연산 타입
             time_limit: 제한 시간
             elapsed_time: 소요 시간
+            game_id: 게임 고유 ID (중복 저장 방지용, 필수)
+            replay: 게임 재생 기록 (로컬 저장소에만 보관)
+            questions: 답안이 기록된 QuestionSet (문제별 이벤트 로그에 기록)
             
         Returns:
-            bool: 저장 성공 여부
+            bool: 저장 예약 성공 여부 (이미 저장된 게임이면 True)
         """
-        if not self.is_enabled:
-            st.warning("⚠️ Google Sheets가 설정되지 않아 결과를 저장할 수 없습니다.")
+        # 데이터 검증
+        if not game_id:
+            _show_message("error", "데이터 검증 실패: 게임 ID가 없습니다")
+            logger.error("game_id 없이 결과 저장 요청")
             return False
         
-        # 데이터 검증
         is_valid, error_msg = data_validator.validate_accuracy_data(correct_count, total_questions)
         if not is_valid:
-            st.error(f"데이터 검증 실패: {error_msg}")
+            _show_message("error", f"데이터 검증 실패: {error_msg}")
             return False
         
         try:
@@ -94,130 +178,85 @@ class SheetsManager:
                 f"{elapsed_time:.1f}초"
             ]
             
-            self.sheet.append_row(row_data)
-            st.success("✔️ 결과가 성공적으로 저장되었습니다!")
-            logger.info(f"게임 결과 저장 완료: 정확도 {accuracy:.1f}%")
+            if not self.local_store.append(row_data, game_id, replay):
+                return True  # 이미 저장된 게임
+            
+            if questions is not None:
+                self.event_log.append_game(game_id, time.time() - elapsed_time, operation_type, questions)
+            
+            self._writer.notify()
+            if self.is_enabled:
+                _show_message("success", "✔️ 결과가 저장 대기열에 추가되었습니다!")
+            else:
+                _show_message("warning", "⚠️ 저장소에 연결되지 않아 결과를 로컬에 저장했습니다. 연결되면 자동으로 전송됩니다.")
+            logger.info(f"게임 결과 로컬 저장: 정확도 {accuracy:.1f}%")
             return True
             
         except Exception as e:
             error_message = f"❌ {ErrorMessages.SHEETS_SAVE_ERROR}: {str(e)}"
-            st.error(error_message)
+            _show_message("error", error_message)
             logger.error(f"데이터 저장 실패: {str(e)}")
             return False
     
+    @timing_recorder.timed()
+    def _append_rows(self, rows: List[List[str]]):
+        """여러 행을 백엔드에 한 번에 저장 (백그라운드 스레드에서 호출)"""
+        # 아직 연결하지 않았거나 이전 연결이 실패했으면 한 번만 연결 시도
+        if self.backend is None:
+            with self._connection_lock:
+                if self.backend is None:
+                    self._initialize_connection(show_warning=False)
+            if self.backend is None:
+                raise ConnectionError("저장소에 연결할 수 없습니다")
+        
+        self.backend.save_results(rows)
+    
+    @timing_recorder.timed()
     def get_global_statistics(self) -> Optional[Dict[str, Any]]:
         """
         전체 사용자 통계 조회
         
+        저장소에 연결되지 않은 경우 로컬 저장소의 데이터로 계산합니다.
+        
         Returns:
             Optional[Dict]: 통계 데이터 또는 None
         """
-        if not self.is_enabled:
-            return None
+        store = self.backend if self.is_enabled else self.local_store
         
         try:
-            rows = self.sheet.get_all_values()
+            stats = store.fetch_aggregates()
             
-            if len(rows) < 2:  # 헤더만 있는 경우
-                st.info("아직 충분한 통계 데이터가 없습니다.")
+            if store.total_rows == 0:  # 헤더만 있는 경우
+                _show_message("info", "아직 충분한 통계 데이터가 없습니다.")
                 return None
             
-            # 헤더 제외
-            data_rows = rows[1:]
-            
-            return self._process_statistics_data(data_rows)
+            return stats
             
         except gspread.exceptions.APIError as e:
-            st.warning(f"Google Sheets API 오류: {str(e)}")
+            _show_message("warning", f"Google Sheets API 오류: {str(e)}")
             logger.error(f"API 오류: {str(e)}")
             return None
         except Exception as e:
-            st.warning(f"{ErrorMessages.SHEETS_LOAD_ERROR}: {str(e)}")
+            _show_message("warning", f"{ErrorMessages.SHEETS_LOAD_ERROR}: {str(e)}")
             logger.error(f"통계 로드 실패: {str(e)}")
             return None
     
-    def _process_statistics_data(self, data_rows: List[List[str]]) -> Dict[str, Any]:
-        """
-        통계 데이터 처리
-        
-        Args:
-            data_rows: Google Sheets에서 가져온 데이터 행들
-            
-        Returns:
-            Dict: 처리된 통계 데이터
-        """
-        total_games = len(data_rows)
-        accuracy_list = []
-        
-        # 정확도 데이터 추출 및 검증
-        for row in data_rows:
-            if not data_validator.validate_sheet_row(row, len(SheetsConfig.COLUMNS)):
-                continue
-            
-            try:
-                accuracy = data_validator.clean_percentage_string(row[4])
-                if 0 <= accuracy <= 100:  # 유효한 범위의 정확도만 추가
-                    accuracy_list.append(accuracy)
-            except (IndexError, ValueError):
-                continue
-        
-        if not accuracy_list:
-            return None
-        
-        # 성과별 분류
-        stats = self._categorize_performance(accuracy_list, total_games)
-        stats.update({
-            'total_games': total_games,
-            'accuracy_list': accuracy_list,
-            'average_accuracy': sum(accuracy_list) / len(accuracy_list)
-        })
-        
-        return stats
-    
-    def _categorize_performance(self, accuracy_list: List[float], total_games: int) -> Dict[str, Any]:
-        """성과별로 데이터 분류"""
-        from config import GameConfig
-        
-        perfect_count = len([acc for acc in accuracy_list if acc == GameConfig.SCORE_PERFECT])
-        great_count = len([acc for acc in accuracy_list if GameConfig.SCORE_GREAT <= acc < GameConfig.SCORE_PERFECT])
-        good_count = len([acc for acc in accuracy_list if GameConfig.SCORE_GOOD <= acc < GameConfig.SCORE_GREAT])
-        okay_count = len([acc for acc in accuracy_list if GameConfig.SCORE_OKAY <= acc < GameConfig.SCORE_GOOD])
-        poor_count = len([acc for acc in accuracy_list if acc < GameConfig.SCORE_OKAY])
-        
-        return {
-            'perfect_count': perfect_count,
-            'perfect_rate': (perfect_count / total_games) * 100,
-            'great_count': great_count,
-            'great_rate': (great_count / total_games) * 100,
-            'good_count': good_count,
-            'good_rate': (good_count / total_games) * 100,
-            'okay_count': okay_count,
-            'okay_rate': (okay_count / total_games) * 100,
-            'poor_count': poor_count,
-            'poor_rate': (poor_count / total_games) * 100
-        }
-    
-    def get_user_rank(self, user_accuracy: float, accuracy_list: List[float]) -> str:
+    @timing_recorder.timed()
+    def get_user_rank(self, user_accuracy: float, rank_index: AccuracyRankIndex) -> str:
         """
         사용자 순위 계산
         
         Args:
             user_accuracy: 사용자 정확도
-            accuracy_list: 전체 사용자 정확도 목록
+            rank_index: 전체 사용자 정확도 순위 인덱스
             
         Returns:
             str: 순위 문자열
         """
-        if not accuracy_list:
+        percentile = rank_index.percentile(user_accuracy)
+        if percentile is None:
             return "순위 계산 불가"
         
-        better_scores = len([acc for acc in accuracy_list if acc > user_accuracy])
-        same_scores = len([acc for acc in accuracy_list if acc == user_accuracy])
-        
-        # 동점자가 있을 경우 평균 순위 계산
-        rank = better_scores + (same_scores + 1) / 2
-        percentile = (rank / len(accuracy_list)) * 100
-        
         return f"상위 {percentile:.1f}%"
 
 # 전역 인스턴스
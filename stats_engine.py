@@ -0,0 +1,226 @@
+# stats_engine.py - 전체 사용자 통계 집계 모듈
+
+import math
+from typing import Optional, Dict, Any, List, Iterable, Sequence
+
+import numpy as np
+
+from config import GameConfig
+
+# 성과 구간 이름 (점수가 높은 순)
+PERFORMANCE_BUCKETS = ('perfect', 'great', 'good', 'okay', 'poor')
+
+# 구간 경계 (낮은 순) - 경계값 이상이면 다음 구간
+_BUCKET_EDGES = np.array([
+    GameConfig.SCORE_OKAY, GameConfig.SCORE_GOOD,
+    GameConfig.SCORE_GREAT, GameConfig.SCORE_PERFECT
+], dtype=float)
+
+# 경계 검색 결과(0~4)에 대응하는 구간 이름
+_BUCKET_BY_EDGE_INDEX = ('poor', 'okay', 'good', 'great', 'perfect')
+
+# 함께 계산할 상위 백분위 기준 (%)
+RANK_PERCENTILES = (10, 25, 50)
+
+# 정확도 히스토그램 해상도 (소수점 한 자리 → 0.0 ~ 100.0 의 1001개 구간)
+ACCURACY_SCALE = 10
+ACCURACY_BINS = 100 * ACCURACY_SCALE + 1
+
+class AccuracyRankIndex:
+    """
+    정확도 순위 조회를 위한 히스토그램 인덱스
+    
+    정확도를 소수점 한 자리 단위의 1001개 구간으로 세고, 누적합을 이용해
+    "더 높은 점수 수"와 "동점자 수"를 O(1)에 조회합니다.
+    """
+    
+    def __init__(self, accuracies: Iterable[float] = ()):
+        self.histogram = [0] * ACCURACY_BINS
+        self.count = 0
+        # higher_counts[i]: i번 구간보다 높은 구간에 속한 개수 (필요할 때 재계산)
+        self._higher_counts: Optional[List[int]] = None
+        self.extend(accuracies)
+    
+    @staticmethod
+    def _to_bin(accuracy: float) -> int:
+        """정확도를 히스토그램 구간 번호로 변환"""
+        return min(max(int(round(accuracy * ACCURACY_SCALE)), 0), ACCURACY_BINS - 1)
+    
+    def add(self, accuracy: float):
+        """정확도 하나 추가"""
+        self.histogram[self._to_bin(accuracy)] += 1
+        self.count += 1
+        self._higher_counts = None
+    
+    def extend(self, accuracies: Iterable[float]):
+        """정확도 여러 개 추가"""
+        for accuracy in accuracies:
+            self.add(accuracy)
+    
+    def _get_higher_counts(self) -> List[int]:
+        """구간별 상위 누적 개수 반환"""
+        higher_counts = self._higher_counts
+        if higher_counts is None:
+            higher_counts = [0] * ACCURACY_BINS
+            running = 0
+            for i in range(ACCURACY_BINS - 1, -1, -1):
+                higher_counts[i] = running
+                running += self.histogram[i]
+            self._higher_counts = higher_counts
+        return higher_counts
+    
+    def count_better_and_same(self, user_accuracy: float) -> tuple:
+        """
+        사용자보다 높은 점수 수와 동점자 수 반환
+        
+        Args:
+            user_accuracy: 사용자 정확도
+        
+        Returns:
+            tuple: (더 높은 점수 수, 동점자 수)
+        """
+        scaled = user_accuracy * ACCURACY_SCALE
+        nearest = round(scaled)
+        
+        if math.isclose(scaled, nearest, abs_tol=1e-6):
+            # 구간 경계와 일치하는 점수: 같은 구간이 동점
+            bin_index = self._to_bin(user_accuracy)
+            return self._get_higher_counts()[bin_index], self.histogram[bin_index]
+        
+        # 구간 사이의 점수 (예: 66.666...): 동점 없이 위쪽 구간부터 모두 상위
+        upper_bin = math.ceil(scaled)
+        if upper_bin >= ACCURACY_BINS:
+            return 0, 0
+        upper_bin = max(upper_bin, 0)
+        return self._get_higher_counts()[upper_bin] + self.histogram[upper_bin], 0
+    
+    def top_cutoff(self, percent: float) -> Optional[float]:
+        """
+        상위 percent% 안에 들기 위한 최소 정확도 계산
+        
+        Args:
+            percent: 상위 백분위 (%)
+        
+        Returns:
+            Optional[float]: 기준 정확도 또는 None (데이터가 없는 경우)
+        """
+        if self.count == 0:
+            return None
+        
+        # 높은 점수부터 누적해 목표 인원에 도달하는 구간 탐색
+        target = max(1, math.ceil(self.count * percent / 100))
+        running = 0
+        for i in range(ACCURACY_BINS - 1, -1, -1):
+            running += self.histogram[i]
+            if running >= target:
+                return i / ACCURACY_SCALE
+        return 0.0
+    
+    def percentile(self, user_accuracy: float) -> Optional[float]:
+        """
+        사용자 정확도의 상위 백분위 계산
+        
+        Returns:
+            Optional[float]: 상위 백분위 (%) 또는 None (데이터가 없는 경우)
+        """
+        if self.count == 0:
+            return None
+        
+        better_scores, same_scores = self.count_better_and_same(user_accuracy)
+        
+        # 동점자가 있을 경우 평균 순위 계산
+        rank = better_scores + (same_scores + 1) / 2
+        return (rank / self.count) * 100
+
+def categorize_accuracies(accuracies: Sequence[float]) -> Dict[str, int]:
+    """
+    정확도 목록을 한 번의 벡터 연산으로 성과 구간별로 분류
+    
+    Args:
+        accuracies: 정확도 목록 (0 ~ 100)
+    
+    Returns:
+        Dict[str, int]: 성과 구간별 개수
+    """
+    values = np.asarray(accuracies, dtype=float)
+    edge_indices = np.searchsorted(_BUCKET_EDGES, values, side='right')
+    counts = np.bincount(edge_indices, minlength=len(_BUCKET_BY_EDGE_INDEX))
+    
+    return {bucket: int(counts[i]) for i, bucket in enumerate(_BUCKET_BY_EDGE_INDEX)}
+
+def summarize_buckets(bucket_counts: Dict[str, int], total_games: int,
+                      rank_index: AccuracyRankIndex) -> Dict[str, Any]:
+    """
+    구간별 개수, 비율, 상위 백분위 기준 정확도를 함께 반환
+    
+    Args:
+        bucket_counts: 성과 구간별 개수
+        total_games: 비율 계산 기준이 되는 전체 게임 수
+        rank_index: 백분위 기준 계산에 사용할 순위 인덱스
+    
+    Returns:
+        Dict: '<구간>_count', '<구간>_rate', 'percentile_cuts' 항목
+    """
+    summary: Dict[str, Any] = {}
+    for bucket in PERFORMANCE_BUCKETS:
+        count = bucket_counts[bucket]
+        summary[f'{bucket}_count'] = count
+        summary[f'{bucket}_rate'] = (count / total_games) * 100 if total_games else 0.0
+    
+    summary['percentile_cuts'] = {
+        percent: rank_index.top_cutoff(percent) for percent in RANK_PERCENTILES
+    }
+    return summary
+
+class StatisticsAggregator:
+    """
+    전체 사용자 통계를 누적 집계하는 클래스
+    
+    새로 추가된 행의 정확도만 반영하므로 갱신 비용은 새 행 수에 비례합니다.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """집계 초기화"""
+        self.total_games = 0
+        self.accuracy_count = 0
+        self.accuracy_sum = 0.0
+        self.bucket_counts = {bucket: 0 for bucket in PERFORMANCE_BUCKETS}
+        self.rank_index = AccuracyRankIndex()
+    
+    def add(self, row_count: int, accuracies: List[float], bucket_counts: Dict[str, int]):
+        """
+        새 행들의 집계 결과 반영
+        
+        Args:
+            row_count: 새로 읽은 전체 행 수 (유효하지 않은 행 포함)
+            accuracies: 새 행들 중 유효한 정확도 목록
+            bucket_counts: 새 행들의 성과 구간별 개수
+        """
+        self.total_games += row_count
+        self.accuracy_count += len(accuracies)
+        self.accuracy_sum += sum(accuracies)
+        self.rank_index.extend(accuracies)
+        
+        for bucket, count in bucket_counts.items():
+            self.bucket_counts[bucket] += count
+    
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        현재까지의 통계 반환
+        
+        Returns:
+            Optional[Dict]: 통계 데이터 또는 None (유효한 데이터가 없는 경우)
+        """
+        if self.accuracy_count == 0:
+            return None
+        
+        stats = summarize_buckets(self.bucket_counts, self.total_games, self.rank_index)
+        stats.update({
+            'total_games': self.total_games,
+            'rank_index': self.rank_index,
+            'average_accuracy': self.accuracy_sum / self.accuracy_count
+        })
+        return stats
@@ -0,0 +1,282 @@
+# storage.py - 게임 결과 저장소 백엔드
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+import gspread
+
+from config import SheetsConfig, StorageConfig
+from validation import data_validator
+from stats_engine import StatisticsAggregator, categorize_accuracies
+
+logger = logging.getLogger(__name__)
+
+class StorageBackend(ABC):
+    """
+    게임 결과 저장소 인터페이스
+    
+    구현체는 행 저장(save_results)과 커서 이후 행 조회(stream_rows)만 제공하면
+    되며, 통계(fetch_aggregates)는 새로 추가된 행만 읽어 누적 집계합니다.
+    """
+    
+    # stream_rows에 처음 전달할 커서
+    initial_cursor = 0
+    
+    def __init__(self):
+        self._stats = StatisticsAggregator()
+        self._stats_cursor = self.initial_cursor
+        self._stats_lock = threading.Lock()
+    
+    def connect(self):
+        """저장소 연결 확인 (실패 시 예외 발생)"""
+    
+    @abstractmethod
+    def save_results(self, rows: List[List[str]]):
+        """여러 결과 행 저장"""
+    
+    @abstractmethod
+    def stream_rows(self, cursor: int) -> Tuple[int, List[List[str]]]:
+        """
+        커서 이후에 저장된 행 조회
+        
+        Args:
+            cursor: 이전 호출에서 반환된 커서 (처음에는 initial_cursor)
+        
+        Returns:
+            Tuple[int, List[List[str]]]: (다음 커서, 행 데이터 목록)
+        """
+    
+    @property
+    def total_rows(self) -> int:
+        """지금까지 집계에 반영된 전체 행 수"""
+        return self._stats.total_games
+    
+    def fetch_aggregates(self) -> Optional[Dict[str, Any]]:
+        """
+        누적 통계 조회 (마지막 조회 이후 추가된 행만 반영)
+        
+        Returns:
+            Optional[Dict]: 통계 데이터 또는 None (유효한 데이터가 없는 경우)
+        """
+        with self._stats_lock:
+            cursor, new_rows = self.stream_rows(self._stats_cursor)
+            if new_rows:
+                self._aggregate_rows(new_rows)
+            self._stats_cursor = cursor
+            
+            return self._stats.snapshot()
+    
+    def _aggregate_rows(self, data_rows: List[List[str]]):
+        """새로 추가된 행의 정확도를 누적 집계에 반영"""
+        accuracy_list = []
+        
+        # 정확도 데이터 추출 및 검증
+        for row in data_rows:
+            if not data_validator.validate_sheet_row(row, len(SheetsConfig.COLUMNS)):
+                continue
+            
+            try:
+                accuracy = data_validator.clean_percentage_string(row[4])
+                if 0 <= accuracy <= 100:  # 유효한 범위의 정확도만 추가
+                    accuracy_list.append(accuracy)
+            except (IndexError, ValueError):
+                continue
+        
+        # 성과별 분류 후 누적
+        bucket_counts = categorize_accuracies(accuracy_list)
+        self._stats.add(len(data_rows), accuracy_list, bucket_counts)
+
+class InMemoryBackend(StorageBackend):
+    """메모리에만 저장하는 백엔드 (테스트 및 부하 테스트용)"""
+    
+    def __init__(self):
+        super().__init__()
+        self._rows: List[List[str]] = []
+        self._lock = threading.Lock()
+    
+    def save_results(self, rows: List[List[str]]):
+        with self._lock:
+            self._rows.extend(list(row) for row in rows)
+    
+    def stream_rows(self, cursor: int) -> Tuple[int, List[List[str]]]:
+        with self._lock:
+            new_rows = self._rows[cursor:]
+        return cursor + len(new_rows), new_rows
+
+class SQLiteBackend(StorageBackend):
+    """SQLite 파일에 저장하는 백엔드"""
+    
+    def __init__(self, db_path: str = StorageConfig.SQLITE_DB_PATH):
+        super().__init__()
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS game_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                row_json TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+    
+    def save_results(self, rows: List[List[str]]):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO game_results (row_json) VALUES (?)",
+                [(json.dumps(row, ensure_ascii=False),) for row in rows]
+            )
+            self._conn.commit()
+    
+    def stream_rows(self, cursor: int) -> Tuple[int, List[List[str]]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, row_json FROM game_results WHERE id > ? ORDER BY id",
+                (cursor,)
+            ).fetchall()
+        
+        if not rows:
+            return cursor, []
+        return rows[-1][0], [json.loads(row_json) for _, row_json in rows]
+
+class SheetsConnectionPool:
+    """
+    프로세스 전체에서 공유하는 Google Sheets 워크시트 연결 풀
+    
+    클라이언트는 필요할 때 최대 size개까지 만들어 재사용하며, 인증 오류가 난
+    클라이언트는 버리고 다음 요청 시 새로 인증합니다. 액세스 토큰은
+    gspread 세션이 만료 시 자동으로 갱신합니다.
+    """
+    
+    def __init__(self, credentials, sheet_id: str, size: int = SheetsConfig.POOL_SIZE):
+        self._credentials = credentials
+        self._sheet_id = sheet_id
+        self.size = size
+        
+        self._idle: "queue.LifoQueue[gspread.Worksheet]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._last_health_check = 0.0
+    
+    def _open_worksheet(self) -> gspread.Worksheet:
+        """새 클라이언트를 인증하고 워크시트 열기"""
+        client = gspread.authorize(self._credentials)
+        spreadsheet = client.open_by_key(self._sheet_id)
+        return spreadsheet.worksheet(SheetsConfig.WORKSHEET_NAME)
+    
+    @contextmanager
+    def acquire(self):
+        """풀에서 워크시트를 빌려 사용 후 반납"""
+        try:
+            worksheet = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            
+            if can_create:
+                try:
+                    worksheet = self._open_worksheet()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    worksheet = self._idle.get(timeout=SheetsConfig.POOL_ACQUIRE_TIMEOUT)
+                except queue.Empty:
+                    raise TimeoutError("사용 가능한 Google Sheets 연결이 없습니다")
+        
+        reusable = True
+        try:
+            yield worksheet
+        except gspread.exceptions.APIError as e:
+            # 인증 오류가 난 클라이언트는 재사용하지 않음
+            if e.response.status_code in (401, 403):
+                reusable = False
+            raise
+        finally:
+            if reusable:
+                self._idle.put(worksheet)
+            else:
+                with self._lock:
+                    self._created -= 1
+    
+    def is_healthy(self) -> bool:
+        """연결 상태 확인 (HEALTH_CHECK_INTERVAL마다 한 번만 실제 요청)"""
+        now = time.monotonic()
+        if now - self._last_health_check < SheetsConfig.HEALTH_CHECK_INTERVAL:
+            return True
+        
+        try:
+            with self.acquire() as worksheet:
+                worksheet.spreadsheet.fetch_sheet_metadata()
+            self._last_health_check = now
+            return True
+        except Exception as e:
+            logger.warning(f"Google Sheets 연결 상태 확인 실패: {str(e)}")
+            return False
+
+class GoogleSheetsBackend(StorageBackend):
+    """Google Sheets에 저장하는 백엔드"""
+    
+    # 1행은 헤더이므로 2행부터 조회
+    initial_cursor = 2
+    
+    def __init__(self, pool_getter: Callable[[], SheetsConnectionPool]):
+        """
+        Args:
+            pool_getter: 공유 연결 풀을 반환하는 함수 (호출 시 상태 확인 포함)
+        """
+        super().__init__()
+        self._pool_getter = pool_getter
+    
+    def connect(self):
+        with self._pool_getter().acquire():
+            pass
+    
+    def save_results(self, rows: List[List[str]]):
+        """여러 행을 한 번의 API 호출로 저장"""
+        with self._pool_getter().acquire() as sheet:
+            sheet.append_rows(rows)
+    
+    def stream_rows(self, cursor: int) -> Tuple[int, List[List[str]]]:
+        """cursor 행부터 마지막 행까지 조회"""
+        with self._pool_getter().acquire() as sheet:
+            new_rows = sheet.get_values(f"A{cursor}:{SheetsConfig.LAST_COLUMN}")
+        
+        # 새 행이 없으면 빈 행이 반환될 수 있으므로 끝의 빈 행 제거
+        while new_rows and not any(new_rows[-1]):
+            new_rows.pop()
+        
+        return cursor + len(new_rows), new_rows
+
+def create_backend(name: str, pool_getter: Optional[Callable[[], SheetsConnectionPool]] = None) -> StorageBackend:
+    """
+    이름에 해당하는 저장소 백엔드 생성
+    
+    Args:
+        name: 백엔드 이름 ("sheets", "sqlite", "memory")
+        pool_getter: Google Sheets 연결 풀을 반환하는 함수 ("sheets"에서만 사용)
+    
+    Returns:
+        StorageBackend: 생성된 백엔드
+    """
+    if name == "sheets":
+        if pool_getter is None:
+            raise ValueError("Google Sheets 백엔드에는 연결 풀이 필요합니다")
+        return GoogleSheetsBackend(pool_getter)
+    elif name == "sqlite":
+        return SQLiteBackend()
+    elif name == "memory":
+        return InMemoryBackend()
+    else:
+        raise ValueError(f"알 수 없는 저장소 백엔드입니다: {name}")
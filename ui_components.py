@@ -1,11 +1,19 @@
 # ui_components.py - UI 컴포넌트 관리 모듈
 
+import os
 import streamlit as st
 from typing import Dict, Any, Optional
 from config import GameConfig, UIConfig
 from game_logic import performance_evaluator
 import streamlit.components.v1 as components
 
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+
+# 답안 입력 컴포넌트 (입력 포커스, Enter 제출, 남은 시간 표시를 브라우저에서 처리)
+_answer_pad = components.declare_component("answer_pad", path=os.path.join(_FRONTEND_DIR, "answer_pad"))
+
+# 게임 한 판을 브라우저에서 진행하는 컴포넌트 (답안은 게임이 끝날 때 한 번에 전송)
+_game_runner = components.declare_component("game_runner", path=os.path.join(_FRONTEND_DIR, "game_runner"))
 
 class GameSetupUI:
     """게임 설정 UI 컴포넌트"""
@@ -29,6 +37,15 @@ class GameSetupUI:
             UIConfig.OPERATION_TYPES
         )
     
+    @staticmethod
+    def render_mode_selector(client_mode: bool) -> bool:
+        """진행 방식 선택기 렌더링 (True이면 브라우저에서 진행)"""
+        return st.toggle(
+            "⚡ 빠른 모드 (브라우저에서 진행)",
+            value=client_mode,
+            help="문제를 한 번에 받아 브라우저에서 풀고, 게임이 끝나면 결과를 한 번에 제출합니다."
+        )
+    
     @staticmethod
     def render_counter(label: str, value: int, min_val: int, max_val: int, 
                       key_prefix: str, unit: str = "개") -> int:
@@ -88,171 +105,56 @@ class GamePlayUI:
         )
     
     @staticmethod
-    def render_timer(remaining_time: float, total_time: int) -> st.empty:
-        """타이머 진행바 렌더링"""
-        if remaining_time <= 0:
-            st.warning("⏳ 시간 초과! 다음 문제로 넘어갑니다.")
-            return None
+    def render_answer_pad(question_key: str, remaining_time: float, time_limit: int,
+                          disabled: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        답안 입력 컴포넌트 렌더링
         
-        time_progress = 1 - (remaining_time / total_time)
-        progress_bar = st.progress(0)
-        progress_bar.progress(time_progress, text=f"⏱️ 남은 시간: {remaining_time:.1f}초")
+        같은 key로 게임 내내 같은 위치에 그리므로 iframe은 한 번만 만들어지고,
+        문제가 바뀌면 인자만 갱신됩니다 (key 기준 식별은 Streamlit 1.50부터). 컴포넌트 값은 마지막 이벤트가 계속
+        남아 있으므로 현재 문제의 이벤트만 반환합니다.
         
-        return progress_bar
+        Args:
+            question_key: 현재 문제를 구분하는 키 (게임 ID와 문제 번호)
+            remaining_time: 남은 시간 (초)
+            time_limit: 문제당 제한 시간 (초)
+            disabled: True이면 입력을 막고 남은 시간 표시를 멈춤 (피드백 단계)
+        
+        Returns:
+            Optional[Dict[str, Any]]: {question_key, answer, timed_out} 또는 None
+        """
+        event = _answer_pad(
+            question_key=question_key,
+            remaining=remaining_time,
+            time_limit=time_limit,
+            disabled=disabled,
+            key="answer_pad",
+            default=None
+        )
+        if not event or event.get('question_key') != question_key:
+            return None
+        return event
     
     @staticmethod
-    def render_answer_form(question_key: str) -> tuple:
-        """답안 입력 폼 렌더링"""
-        with st.form(key=f"question_{question_key}"):
-            user_input = st.text_input(
-                "답을 입력하세요:", 
-                key=f"answer_input_{question_key}",
-                placeholder="숫자를 입력하세요"
-            )
-            submitted = st.form_submit_button("제출", use_container_width=True, type="primary")
+    def render_game_runner(batch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        브라우저 게임 진행 컴포넌트 렌더링
         
-        # 정교한 포커스 스크립트 - 특정 input 타겟팅
-        st.components.v1.html(f"""
-            <script>
-            (function() {{
-                let attemptCount = 0;
-                const maxAttempts = 15;
-                const questionKey = "{question_key}";
-                
-                function focusSpecificInput() {{
-                    attemptCount++;
-                    console.log(`포커스 시도 ${{attemptCount}}/${{maxAttempts}} - 문제 ${{questionKey}}`);
-                    
-                    try {{
-                        const doc = window.parent ? window.parent.document : document;
-                        let targetInput = null;
-                        
-                        // 방법 1: 현재 문제의 특정 input 찾기 (key 기반)
-                        const keySelectors = [
-                            `input[data-testid*="answer_input_${{questionKey}}"]`,
-                            `input[aria-label*="답을 입력하세요"]`,
-                            `input[placeholder*="숫자를 입력하세요"]`
-                        ];
-                        
-                        for (const selector of keySelectors) {{
-                            targetInput = doc.querySelector(selector);
-                            if (targetInput) {{
-                                console.log(`선택자로 찾음: ${{selector}}`);
-                                break;
-                            }}
-                        }}
-                        
-                        // 방법 2: 폼 컨테이너 내부에서 찾기
-                        if (!targetInput) {{
-                            const forms = doc.querySelectorAll('form[data-testid*="question_${{questionKey}}"], form[data-testid*="form"]');
-                            for (const form of forms) {{
-                                const formInput = form.querySelector('input[type="text"]');
-                                if (formInput) {{
-                                    targetInput = formInput;
-                                    console.log('폼 내부에서 찾음');
-                                    break;
-                                }}
-                            }}
-                        }}
-                        
-                        // 방법 3: 가장 최근 활성 input (fallback)
-                        if (!targetInput) {{
-                            const allInputs = Array.from(doc.querySelectorAll('input[type="text"]:not([readonly]):not([disabled])'));
-                            // 보이는 input만 필터링
-                            const visibleInputs = allInputs.filter(input => {{
-                                const rect = input.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }});
-                            
-                            if (visibleInputs.length > 0) {{
-                                targetInput = visibleInputs[visibleInputs.length - 1];
-                                console.log('최근 활성 input 사용');
-                            }}
-                        }}
-                        
-                        // 포커스 적용
-                        if (targetInput && doc.activeElement !== targetInput) {{
-                            targetInput.focus();
-                            
-                            // 기존 값이 있으면 선택, 없으면 커서만 설정
-                            setTimeout(() => {{
-                                if (targetInput.value && targetInput.value.trim() !== '') {{
-                                    targetInput.select();
-                                }}
-                            }}, 10);
-                            
-                            console.log(`✅ 포커스 성공: 문제 ${{questionKey}}`);
-                            return true;
-                        }}
-                        
-                        // 재시도 조건
-                        if (attemptCount < maxAttempts) {{
-                            setTimeout(focusSpecificInput, attemptCount < 5 ? 100 : 200);
-                        }} else {{
-                            console.log(`❌ 포커스 실패: 문제 ${{questionKey}} (최대 시도 도달)`);
-                        }}
-                        
-                        return false;
-                    }} catch (e) {{
-                        console.log(`포커스 에러: ${{e.message}}`);
-                        if (attemptCount < maxAttempts) {{
-                            setTimeout(focusSpecificInput, 200);
-                        }}
-                        return false;
-                    }}
-                }}
-                
-                // 즉시 실행
-                focusSpecificInput();
-                
-                // 추가 시도들 (다양한 타이밍)
-                setTimeout(focusSpecificInput, 50);
-                setTimeout(focusSpecificInput, 150);
-                setTimeout(focusSpecificInput, 300);
-                setTimeout(focusSpecificInput, 500);
-                
-                // DOM 변경 감지
-                const observer = new MutationObserver(function(mutations) {{
-                    let shouldFocus = false;
-                    
-                    mutations.forEach(function(mutation) {{
-                        if (mutation.type === 'childList') {{
-                            mutation.addedNodes.forEach(node => {{
-                                if (node.nodeType === 1) {{ // Element node
-                                    if (node.matches && node.matches('input[type="text"]')) {{
-                                        shouldFocus = true;
-                                    }} else if (node.querySelector) {{
-                                        const inputs = node.querySelectorAll('input[type="text"]');
-                                        if (inputs.length > 0) {{
-                                            shouldFocus = true;
-                                        }}
-                                    }}
-                                }}
-                            }});
-                        }}
-                    }});
-                    
-                    if (shouldFocus) {{
-                        console.log('DOM 변경 감지 - 포커스 재시도');
-                        setTimeout(focusSpecificInput, 50);
-                    }}
-                }});
-                
-                observer.observe(document.body, {{
-                    childList: true,
-                    subtree: true
-                }});
-                
-                // observer 정리 (메모리 누수 방지)
-                setTimeout(() => {{
-                    observer.disconnect();
-                    console.log('Observer 정리됨');
-                }}, 5000);
-            }})();
-            </script>
-        """, height=0)
+        Args:
+            batch: GameSession.get_client_batch()의 문제 배치
         
-        return user_input, submitted
+        Returns:
+            Optional[Dict[str, Any]]: 이번 게임이 끝났으면 {game_id, seed, answers, response_times}
+        """
+        event = _game_runner(
+            batch=batch,
+            feedback_duration=GameConfig.FEEDBACK_DURATION,
+            key="game_runner",
+            default=None
+        )
+        if not event or event.get('game_id') != batch['game_id']:
+            return None
+        return event
 
 class GameResultUI:
     """게임 결과 UI 컴포넌트"""
@@ -359,8 +261,9 @@ class GameResultUI:
         """사용자 순위 렌더링"""
         from sheets_manager import sheets_manager
         
-        rank_text = sheets_manager.get_user_rank(user_accuracy, stats['accuracy_list'])
-        percentile = float(rank_text.replace('상위 ', '').replace('%', ''))
+        rank_index = stats['rank_index']
+        rank_text = sheets_manager.get_user_rank(user_accuracy, rank_index)
+        percentile = rank_index.percentile(user_accuracy)
         
         st.markdown(f"""
         <div style='text-align: center; padding: 15px; background-color: #f0f2f6; border-radius: 10px; margin: 10px 0;'>
@@ -1,9 +1,21 @@
 # validation.py - 입력 검증 및 유틸리티 함수
 
-from typing import Tuple, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 from config import GameConfig, ErrorMessages
 import re
 
+# 답안 검증 결과 (제출마다 새로 만들지 않도록 미리 생성)
+_INVALID_NUMBER_RESULT = (False, ErrorMessages.INVALID_NUMBER)
+_VALID_NUMBER_RESULTS = tuple(
+    (True, value) for value in range(GameConfig.MIN_ANSWER, GameConfig.MAX_ANSWER + 1)
+)
+
+@lru_cache(maxsize=None)
+def _out_of_range_result(min_val: int, max_val: int) -> Tuple[bool, str]:
+    """범위 초과 결과 (범위별로 한 번만 생성)"""
+    return False, ErrorMessages.NUMBER_OUT_OF_RANGE.format(min_val=min_val, max_val=max_val)
+
 class InputValidator:
     """사용자 입력 검증을 위한 클래스"""
     
@@ -18,32 +30,30 @@ class InputValidator:
             user_input (str): 사용자 입력 문자열
             min_val (int): 최소값
             max_val (int): 최대값
-            
+        
         Returns:
             Tuple[bool, Union[int, str]]: (성공여부, 변환된_값_또는_에러메시지)
         """
-        if not user_input or not user_input.strip():
-            return False, ErrorMessages.INVALID_NUMBER
-            
-        # 공백 제거 및 기본 정리
-        cleaned_input = user_input.strip()
+        # 공백 제거 및 기본 정리 (앞뒤 공백이 없으면 같은 문자열 객체 반환)
+        cleaned_input = user_input.strip() if user_input else ""
         
-        # 숫자와 음수 기호만 허용하는 정규표현식
-        if not re.match(r'^-?\d+$', cleaned_input):
-            return False, ErrorMessages.INVALID_NUMBER
+        # 숫자와 음수 기호만 허용 (정규표현식 '^-?\d+$'와 같은 조건)
+        if not (cleaned_input.isdecimal() or
+                (cleaned_input[:1] == "-" and cleaned_input[1:].isdecimal())):
+            return _INVALID_NUMBER_RESULT
         
         try:
             value = int(cleaned_input)
-            
-            if min_val <= value <= max_val:
-                return True, value
-            else:
-                return False, ErrorMessages.NUMBER_OUT_OF_RANGE.format(
-                    min_val=min_val, max_val=max_val
-                )
-                
         except ValueError:
-            return False, ErrorMessages.INVALID_NUMBER
+            return _INVALID_NUMBER_RESULT
+        
+        if not min_val <= value <= max_val:
+            return _out_of_range_result(min_val, max_val)
+        
+        # 기본 입력 범위의 값은 미리 만든 결과 재사용
+        if GameConfig.MIN_ANSWER <= value <= GameConfig.MAX_ANSWER:
+            return _VALID_NUMBER_RESULTS[value - GameConfig.MIN_ANSWER]
+        return True, value
     
     @staticmethod
     def validate_question_count(count: int) -> bool:
@@ -79,7 +89,14 @@ class GameValidator:
         return operation_type in UIConfig.OPERATION_TYPES
     
     @staticmethod
-    def validate_game_settings(question_count: int, time_limit: int, operation_type: str) -> Tuple[bool, str]:
+    def is_valid_difficulty(difficulty: Optional[str]) -> bool:
+        """난이도 프로필 유효성 검증 (None은 난이도 구분 없음)"""
+        from config import DifficultyConfig
+        return difficulty is None or difficulty in DifficultyConfig.PROFILES
+    
+    @staticmethod
+    def validate_game_settings(question_count: int, time_limit: int, operation_type: str,
+                               difficulty: Optional[str] = None) -> Tuple[bool, str]:
         """게임 설정 전체 유효성 검증"""
         if not InputValidator.validate_question_count(question_count):
             return False, f"문제 개수는 {GameConfig.MIN_QUESTIONS}개에서 {GameConfig.MAX_QUESTIONS}개 사이여야 합니다."
@@ -90,6 +107,9 @@ class GameValidator:
         if not GameValidator.is_valid_operation_type(operation_type):
             return False, "올바르지 않은 연산 타입입니다."
         
+        if not GameValidator.is_valid_difficulty(difficulty):
+            return False, "올바르지 않은 난이도입니다."
+        
         return True, "설정이 유효합니다."
     
     @staticmethod